@@ -6,15 +6,26 @@ assert that Wheatley does not crash.  With decent test coverage, this prevents m
 and argument errors.
 """
 
-from subprocess import STDOUT, TimeoutExpired, Popen, PIPE
+from asyncio.subprocess import PIPE
+import asyncio
+import json
 import os
+import re
 import shlex
 import sys
+import tempfile
 
 # ID of a tower that I made called 'DO NOT ENTER'
 ROOM_ID = "238915467"
 EXAMPLE_METHOD = "Plain Bob Major"
 IGNORE_STRING = "<!--- doctest-ignore -->"
+# Matches (and captures) the README lines which `get_all_tests` cares about: code fences, lines starting
+# with `wheatley` and lines which are exactly `IGNORE_STRING`
+README_LINE_REGEX = re.compile(
+    r"^[ \t]*(```.*|wheatley.*|" + re.escape(IGNORE_STRING) + r"[ \t]*$)", re.MULTILINE
+)
+# How long a single test can run before it is considered to have hung
+TEST_TIMEOUT = 10  # seconds
 
 
 # Tests that should be run on top of the examples from README.md
@@ -27,53 +38,73 @@ def get_all_tests():
     tests = []
 
     with open("README.md") as readme:
-        is_in_code = False
-        ignore_next_examples = False
+        text = readme.read()
+
+    is_in_code = False
+    ignore_next_examples = False
+    # Keep track of the line number as we go, so that we only have to count the newlines once
+    line_number = 0
+    line_number_pos = 0
+
+    # Only the lines which are code fences, examples or ignore markers affect the tests, so use one regex to
+    # jump straight to them rather than looking at every line of the README
+    for match in README_LINE_REGEX.finditer(text):
+        stripped_line = match.group(1).strip()
+        line_number += text.count("\n", line_number_pos, match.start())
+        line_number_pos = match.start()
+
+        # If we see the line IGNORE_STRING, we should ignore the next block of examples
+        if not is_in_code and stripped_line == IGNORE_STRING:
+            ignore_next_examples = True
+
+        if stripped_line.startswith("```"):
+            # Alternate into or out of code blocks
+            is_in_code = not is_in_code
+
+            # Clear the ignore flag whenever we *finish* a code block
+            if not is_in_code:
+                ignore_next_examples = False
+
+        # If this is a code line that starts with `wheatley`, then it should be used as an example
+        if is_in_code and stripped_line.startswith("wheatley"):
+            if ignore_next_examples:
+                print(f"Ignoring README.md:{line_number}: {stripped_line}")
+            else:
+                tests.append((f"README.md:{line_number}", stripped_line))
 
-        for i, l in enumerate(readme.read().split("\n")):
-            stripped_line = l.strip()
-
-            # If we see the line IGNORE_STRING, we should ignore the next block of examples
-            if not is_in_code and stripped_line == IGNORE_STRING:
-                ignore_next_examples = True
+    return tests + [(f"EXTRA_TESTS:{i}", cmd) for i, cmd in EXTRA_TESTS]
 
-            if stripped_line.startswith("```"):
-                # Alternate into or out of code blocks
-                is_in_code = not is_in_code
 
-                # Clear the ignore flag whenever we *finish* a code block
-                if not is_in_code:
-                    ignore_next_examples = False
+def run_wheatley_command():
+    """
+    Get the args which run `./run-wheatley` with the current Python.  This way, the tests will run on the
+    version contained in the current commit, rather than a release version.
+    """
+    command = ["python", "./run-wheatley"]
 
-            # If this is a code line that starts with `wheatley`, then it should be used as an example
-            if is_in_code and stripped_line.startswith("wheatley"):
-                if ignore_next_examples:
-                    print(f"Ignoring README.md:{i}: {stripped_line}")
-                else:
-                    tests.append((f"README.md:{i}", stripped_line))
+    # Check if running inside venv, if so we need to activate in each process
+    if sys.prefix != sys.base_prefix and os.name == "nt":
+        # Windows path `\` gets dropped, but Windows is happy to accept `/` instead
+        activate_script = sys.prefix.replace("\\", "/") + "/Scripts/activate"
+        activate_script += ".bat"
+        command = [activate_script, "&"] + command
 
-    return tests + [(f"EXTRA_TESTS:{i}", cmd) for i, cmd in EXTRA_TESTS]
+    return command
 
 
 def command_to_converted_args(location, command):
-    # Bit of a hack, but this will convert commands starting with 'wheatley' to start with './run-wheatley'
-    # and make sure that [ID NUMBER] is replaced with a valid room ID.  This way, the tests will run on the
-    # version contained in the current commit, rather than a release version.
-    edited_command = "python ./run-" + command.replace("[ID NUMBER]", ROOM_ID).replace(
+    # Bit of a hack, but this will make sure that [ID NUMBER] is replaced with a valid room ID, and then split
+    # off the args which get passed to Wheatley (i.e. everything after 'wheatley').  The command which runs
+    # `./run-wheatley` is the same for every test, so it is only built once (by `run_wheatley_command`).
+    substituted_command = command.replace("[ID NUMBER]", ROOM_ID).replace(
         "[METHOD TITLE]", '"' + EXAMPLE_METHOD + '"'
     )
-    insert_arg_index = 2
+    args = shlex.split(substituted_command)[1:]
 
-    # Check if running inside venv, if so we need to activate in each process
+    # The equivalent shell command, which is printed when reporting the test's result
+    edited_command = "python ./run-" + substituted_command
     if sys.prefix != sys.base_prefix and os.name == "nt":
-        # Windows path `\` gets dropped, but Windows is happy to accept `/` instead
-        activate_script = sys.prefix.replace("\\", "/") + "/Scripts/activate"
-        activate_script += ".bat"
-        edited_command = activate_script + " & " + edited_command
-        insert_arg_index = 4
-
-    args = shlex.split(edited_command)
-    args.insert(insert_arg_index, "integration-test")
+        edited_command = " ".join(run_wheatley_command()[:2]) + " " + edited_command
 
     return (args, location, edited_command)
 
@@ -104,47 +135,111 @@ class CommandError:
         return "ERROR"
 
 
-def check_test(proc):
-    try:
-        out, err = proc.communicate(timeout=10)
-        if proc.returncode != 0:
-            return CommandError(proc.returncode, out.decode("utf-8"))
-    except TimeoutExpired:
-        proc.kill()
-        return Timeout()
+class TestServer:
+    """
+    A `run-wheatley integration-test-server` process, which runs many tests one after the other so that
+    Python only has to start (and import Wheatley) once rather than once per test.
+    """
+
+    def __init__(self, command, env):
+        self._command = command + ["integration-test-server"]
+        self._env = env
+        self._proc = None
+        self._stderr = None
+
+    async def run_test(self, args):
+        """Run one test to completion, returning `None` if it succeeded or the error otherwise."""
+        if self._proc is None:
+            self._proc = await asyncio.create_subprocess_exec(
+                *self._command, stdin=PIPE, stdout=PIPE, stderr=PIPE, env=self._env
+            )
+            # Keep draining stderr in the background, so that the server can never block on a full pipe
+            self._stderr = asyncio.ensure_future(self._proc.stderr.read())
+
+        try:
+            self._proc.stdin.write((json.dumps(args) + "\n").encode("utf-8"))
+            await self._proc.stdin.drain()
+            response = await asyncio.wait_for(self._proc.stdout.readline(), TEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            # The test has hung, so kill the server (a new one will be started for the next test)
+            self._proc.kill()
+            await self._stopped()
+            return Timeout()
+        except ConnectionError:
+            # The server has already died, so the write failed
+            response = b""
+
+        if response:
+            try:
+                result = json.loads(response)
+                return CommandError(result["rc"], result["out"]) if result["rc"] != 0 else None
+            except (ValueError, TypeError, KeyError):
+                # The reply is garbled, so fail this test and restart the server, since its replies can no
+                # longer be trusted
+                self._proc.kill()
+                return_code, err = await self._stopped()
+                return CommandError(return_code, f"Malformed reply from test server: {response!r}\n{err}")
+
+        # The server crashed
+        return_code, err = await self._stopped()
+        return CommandError(return_code, err)
+
+    async def close(self):
+        """Stop the server, if it's running."""
+        if self._proc is not None:
+            self._proc.stdin.close()
+            await self._stopped()
+
+    async def _stopped(self):
+        """Wait for the server to exit, returning its return code and anything it wrote to stderr."""
+        return_code = await self._proc.wait()
+        err = await self._stderr
+        self._proc = None
+        self._stderr = None
+        return (return_code, err.decode("utf-8"))
+
+
+async def run_tests(command, converted_commands, max_processes, report_result, env):
+    """
+    Run all the tests on a pool of `TestServer`s (whose processes get the environment variables `env`),
+    calling `report_result` with each test's location, command and error (or `None`) as soon as that test
+    finishes.
+    """
+    idle_servers = asyncio.Queue()
+    servers = [TestServer(command, env) for _ in range(max_processes)]
+    for server in servers:
+        idle_servers.put_nowait(server)
+
+    async def run_one(args, location, edited_command):
+        server = await idle_servers.get()
+        try:
+            return (location, edited_command, await server.run_test(args))
+        finally:
+            idle_servers.put_nowait(server)
+
+    tests = [
+        run_one(args, location, edited_command) for (args, location, edited_command) in converted_commands
+    ]
+    # Report the results as soon as each test finishes, rather than in the order they were started
+    for next_result in asyncio.as_completed(tests):
+        report_result(*await next_result)
+
+    for server in servers:
+        await server.close()
 
 
 def main():
     """Generate and run all the tests, asserting that Wheatley does not crash."""
     errors = []
-    procs = []
-    max_processes = 16
+    # Each test server is its own Wheatley process, so only start as many as we have CPUs for
+    max_processes = min(16, os.cpu_count() or 1)
 
     # Generate all the edited commands upfront, so that we can line up all the errors
     converted_commands = [command_to_converted_args(location, cmd) for (location, cmd) in get_all_tests()]
 
     max_command_length = max([len(cmd) for (_, _, cmd) in converted_commands])
 
-    converted_commands_count = len(converted_commands)
-    process_index = min(converted_commands_count, max_processes)
-
-    # Start the original set of processes
-    for i in range(process_index):
-        (args, location, edited_command) = converted_commands[i]
-        procs.append(Popen(args, stderr=STDOUT, stdout=PIPE))
-
-    print("Jobs started")
-
-    for i in range(converted_commands_count):
-        (args, location, edited_command) = converted_commands[i]
-        error = check_test(procs[i])
-
-        # Start next process if needed
-        if process_index < converted_commands_count:
-            (args, location, edited_command) = converted_commands[process_index]
-            procs.append(Popen(args, stderr=STDOUT, stdout=PIPE))
-            process_index += 1
-
+    def report_result(location, edited_command, error):
         result_text = "ok"
 
         if error is not None:
@@ -152,7 +247,16 @@ def main():
 
             result_text = error.result_text()
 
-        print(edited_command + " " + "." * (max_command_length + 3 - len(edited_command)) + " " + result_text)
+        # Pad the commands with dots so that the results line up
+        print(f"{edited_command + ' ':.<{max_command_length + 4}} {result_text}")
+
+    print("Jobs started")
+
+    # All the waiting on the test servers happens on one thread, through asyncio.  The tests get their
+    # own HTTP cache directory, so that they never write to (or read from) the user's real cache.
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, XDG_CACHE_HOME=cache_dir)
+        asyncio.run(run_tests(run_wheatley_command(), converted_commands, max_processes, report_result, env))
 
     # Iterate over the errors
     if len(errors) == 0:
@@ -1,5 +1,8 @@
 """ Utils for the fuzzing code. """
 
+import functools
+import multiprocessing
+
 
 class FuzzingError(ValueError):
     """A custom error used to signal that some un-abstracted errors were found."""
@@ -16,30 +19,62 @@ class FuzzingError(ValueError):
         return f"'{self._function_name}' threw uncaught errors:\n{error_messages}"
 
 
-def fuzz_for_unwrapped_errors(
-    function_name, function_to_fuzz, input_generation_function, expected_error, iterations=100000
-):
-    """Fuzz a given function with generated input, checking for a given error."""
+def random_strings(alphabet, count, max_length=20):
+    """
+    Generate `count` random strings, each made of up to `max_length` characters from the (ASCII) `alphabet`.
+    All the random numbers are generated in bulk by numpy, which is much faster than generating the
+    strings one character at a time.
+    """
+    # numpy is only needed to generate fuzzer inputs, so don't make importing this module depend on it
+    import numpy  # type: ignore  # pylint: disable=import-outside-toplevel
 
-    errors_found = []
+    rng = numpy.random.default_rng()
+    lengths = rng.integers(0, max_length + 1, size=count)
+    # Generate the characters of every string as one long string, then slice it into the individual strings
+    alphabet_bytes = numpy.frombuffer(alphabet.encode("ascii"), dtype=numpy.uint8)
+    characters = alphabet_bytes[rng.integers(0, len(alphabet_bytes), size=int(lengths.sum()))]
+    all_strings = characters.tobytes().decode("ascii")
+    ends = numpy.cumsum(lengths).tolist()
+    return [all_strings[end - length : end] for end, length in zip(ends, lengths.tolist())]
+
+
+def check_input(function_to_fuzz, expected_error, generated_input):
+    """
+    Run `function_to_fuzz` on one input, returning a description of the error if it threw anything other
+    than `expected_error` (or `None` otherwise).
+    """
+    try:
+        function_to_fuzz(generated_input)
+    except expected_error:
+        pass
+    except Exception as e:
+        # Name the error class in the same way as Python does (i.e. don't prefix built-in errors)
+        error_class = type(e)
+        error_type = error_class.__qualname__
+        if error_class.__module__ != "builtins":
+            error_type = f"{error_class.__module__}.{error_type}"
 
-    for _ in range(iterations):
-        generated_input = input_generation_function()
+        return f"Error type '{error_type}' thrown on input '{generated_input}': '{e}'."
 
-        try:
-            function_to_fuzz(generated_input)
-        except expected_error:
-            pass
-        except Exception as e:
-            error_type = str(type(e))
+    return None
 
-            if "'" in error_type:
-                error_type = error_type.split("'")[1]
 
-            errors_found.append(f"Error type '{error_type}' thrown on input '{generated_input}': '{e}'.")
+def fuzz_for_unwrapped_errors(function_name, function_to_fuzz, generated_inputs, expected_error):
+    """Fuzz a given function with generated input, checking for a given error."""
+
+    errors_found = []
+    iterations = len(generated_inputs)
+
+    # Every input can be checked independently, so spread them over all the CPU cores.  The inputs are sent
+    # to the worker processes in large chunks so that the inter-process communication doesn't dominate.
+    check = functools.partial(check_input, function_to_fuzz, expected_error)
+    with multiprocessing.Pool() as pool:
+        for error in pool.imap_unordered(check, generated_inputs, chunksize=2048):
+            if error is not None:
+                errors_found.append(error)
 
-            if len(errors_found) > 10:
-                break
+                if len(errors_found) > 10:
+                    break
 
     if len(errors_found) == 0:
         print(
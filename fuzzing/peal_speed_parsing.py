@@ -1,19 +1,24 @@
 """ Run a fuzzer to generate lots of random input for the peal speed parser. """
 
-from random import choice, randint
-
 from wheatley.parsing import parse_peal_speed, PealSpeedParseError
 
-from .fuzz_utils import fuzz_for_unwrapped_errors
+from .fuzz_utils import fuzz_for_unwrapped_errors, random_strings
+
+# The characters that generated inputs are made from
+PEAL_SPEED_ALPHABET = "1234567890hm,\nx?ET "
 
 
-def random_peal_speed_string():
-    """Generate a plausible input value for `wheatley.arg_parsing.parse_peal_speed` to parse."""
+def random_peal_speed_strings(count):
+    """Generate `count` plausible input values for `wheatley.arg_parsing.parse_peal_speed` to parse."""
 
-    return "".join([choice("1234567890hm,\nx?ET ") for _ in range(randint(0, 20))])
+    return random_strings(PEAL_SPEED_ALPHABET, count)
 
 
-def fuzz_parse_peal_speed():
+def fuzz_parse_peal_speed(iterations=100000):
     fuzz_for_unwrapped_errors(
-        "parse_peal_speed", parse_peal_speed, random_peal_speed_string, PealSpeedParseError
+        "parse_peal_speed", parse_peal_speed, random_peal_speed_strings(iterations), PealSpeedParseError
     )
+
+
+if __name__ == "__main__":
+    fuzz_parse_peal_speed()
@@ -1,16 +1,11 @@
 #!/usr/bin/env python3
 import argparse
 import os
-
-import mypy.api
-import pytest
-from io import StringIO
-from pylint.lint import Run as run_pylint
-from pylint.reporters.text import TextReporter
 import sys
 
-import doctests
-import fuzzing
+# The tools for each check are only imported if that check is run, since importing them (especially mypy
+# and pylint) is slow.  This also keeps them out of the fuzzer's worker processes, which re-import this
+# script on Windows.
 
 parser = argparse.ArgumentParser(
     description="Run all or some checks on the codebase. Stops at first failed check"
@@ -54,61 +49,79 @@ class Check:
             print(message[2:])
 
 
-# Ignore first argument (this file name)
-mypy_args = sys.argv[1:]
-parsed_args = parser.parse_args(mypy_args)
-# Run all if no option specified
-run_all = len(mypy_args) == 0
-
-if run_all or parsed_args.unit_tests:
-    with Check("Unit tests"):
-        print("python -m pytest")
-        exit_code = pytest.main([])
-        if exit_code:
-            exit(exit_code)
-
-if run_all or parsed_args.doc_tests:
-    with Check("Documentation tests"):
-        print("python doctests.py")
-        doctests.main()
-
-if run_all or parsed_args.fuzz:
-    with Check("Fuzzing"):
-        print("python -m fuzzing")
-        fuzzing.run()
-
-if run_all or parsed_args.lint:
-    with Check("Linting"):
-        print("python -m pylint wheatley")
-        pylint_args = ["wheatley"]
-        if os.name != "nt":
-            pylint_args.append("--enable=unexpected-line-ending-format")
-
-        # Custom open stream
-        pylint_output = StringIO()
-        reporter = TextReporter(pylint_output)
-
-        run_pylint(pylint_args, reporter=reporter, exit=False)
-
-        output = pylint_output.getvalue()
-        print(output)
-        success = output.find("Your code has been rated at 10")
-        if success == -1:
-            exit(1)
-
-if run_all or parsed_args.type_check:
-    with Check("Type check"):
-        print("python -m mypy wheatley --pretty --disallow-incomplete-defs --disallow-untyped-defs")
-        mypy_args = ["wheatley", "--pretty", "--disallow-incomplete-defs", "--disallow-untyped-defs"]
-        stdout, stderr, exit_status = mypy.api.run(mypy_args)
-        print(stdout)
-        print(stderr, file=sys.stderr)
-        if exit_status:
-            exit(exit_status)
-
-
-print(
-    """
+def main():
+    # Ignore first argument (this file name)
+    mypy_args = sys.argv[1:]
+    parsed_args = parser.parse_args(mypy_args)
+    # Run all if no option specified
+    run_all = len(mypy_args) == 0
+
+    if run_all or parsed_args.unit_tests:
+        with Check("Unit tests"):
+            print("python -m pytest")
+            import pytest
+
+            exit_code = pytest.main([])
+            if exit_code:
+                exit(exit_code)
+
+    if run_all or parsed_args.doc_tests:
+        with Check("Documentation tests"):
+            print("python doctests.py")
+            import doctests
+
+            doctests.main()
+
+    if run_all or parsed_args.fuzz:
+        with Check("Fuzzing"):
+            print("python -m fuzzing")
+            import fuzzing
+
+            fuzzing.run()
+
+    if run_all or parsed_args.lint:
+        with Check("Linting"):
+            print("python -m pylint wheatley")
+            from io import StringIO
+            from pylint.lint import Run as run_pylint
+            from pylint.reporters.text import TextReporter
+
+            pylint_args = ["wheatley"]
+            if os.name != "nt":
+                pylint_args.append("--enable=unexpected-line-ending-format")
+
+            # Custom open stream
+            pylint_output = StringIO()
+            reporter = TextReporter(pylint_output)
+
+            run_pylint(pylint_args, reporter=reporter, exit=False)
+
+            output = pylint_output.getvalue()
+            print(output)
+            success = output.find("Your code has been rated at 10")
+            if success == -1:
+                exit(1)
+
+    if run_all or parsed_args.type_check:
+        with Check("Type check"):
+            print("python -m mypy wheatley --pretty --disallow-incomplete-defs --disallow-untyped-defs")
+            import mypy.api
+
+            mypy_args = ["wheatley", "--pretty", "--disallow-incomplete-defs", "--disallow-untyped-defs"]
+            stdout, stderr, exit_status = mypy.api.run(mypy_args)
+            print(stdout)
+            print(stderr, file=sys.stderr)
+            if exit_status:
+                exit(exit_status)
+
+    print(
+        """
 ====== Success ======
     """
-)
+    )
+
+
+# The fuzzer runs on a multiprocessing pool, and (on Windows) the worker processes re-import this script.
+# Only run the checks in the original process.
+if __name__ == "__main__":
+    main()
@@ -27,8 +27,6 @@ setuptools.setup(
     ],
     python_requires=">=3.6",
     install_requires=[
-        'numpy==1.19.5; python_version < "3.8"',
-        'numpy; python_version >= "3.8"',
         "requests",
         "python-socketio~=5.8.0",
         "python-engineio~=4.5.1",
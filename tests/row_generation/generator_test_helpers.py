@@ -6,7 +6,7 @@ from wheatley.stroke import Stroke, HANDSTROKE
 
 def rounds(stage: int) -> List[int]:
     number_of_bells = stage + 1 if stage % 2 else stage
-    return [i for i in range(1, number_of_bells + 1)]
+    return list(range(1, number_of_bells + 1))
 
 
 def as_bells(nums: List[int]) -> List[Bell]:
@@ -1,13 +1,25 @@
+import os
+import tempfile
 import unittest
-from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, mock
 
 
 from wheatley.row_generation import ComplibCompositionGenerator
+from wheatley.web import MAX_CONNECTIONS_PER_HOST
 
 
 class CompLibGeneratorTests(TestCase):
+    def setUp(self):
+        # Keep the fetched compositions out of the real HTTP cache
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        environ_patch = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name})
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+
     def test_comp_fetching(self):
-        for url, expected_title in [
+        test_cases = [
             ("complib.org/composition/62355", "5040 Plain Bob Major by Ben White-Horne"),
             ("www.complib.org/composition/62355", "5040 Plain Bob Major by Ben White-Horne"),
             ("https://www.complib.org/composition/71994", "110 2-Spliced Major"),
@@ -21,9 +33,16 @@ class CompLibGeneratorTests(TestCase):
                 + "&accessKey=9e1fcd2b11435552cf236be93c7ff73058870995",
                 "720 Moss Treble Place Minor",
             ),
-        ]:
-            with self.subTest(url=url, expected_title=expected_title):
-                self.assertEqual(ComplibCompositionGenerator.from_arg(url).comp_title, expected_title)
+        ]
+
+        # Fetch the compositions concurrently, since this test spends almost all its time waiting for
+        # CompLib.  Only send as many requests at once as the session keeps connections for.
+        with ThreadPoolExecutor(max_workers=MAX_CONNECTIONS_PER_HOST) as executor:
+            generators = [executor.submit(ComplibCompositionGenerator.from_arg, url) for url, _ in test_cases]
+
+            for (url, expected_title), generator in zip(test_cases, generators):
+                with self.subTest(url=url, expected_title=expected_title):
+                    self.assertEqual(generator.result().comp_title, expected_title)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ from wheatley.row_generation.helpers import (
     convert_to_bell_string,
     convert_pn,
     generate_starting_row,
+    place_notation_permutation,
+    valid_pn,
 )
 from wheatley.row_generation.helpers import _CROSS_PN
 from wheatley.bell import MAX_BELL, Bell
@@ -71,12 +73,46 @@ class HelpersPlaceNotationTests(unittest.TestCase):
             ("-1,2.3,4", [_CROSS_PN, [1], _CROSS_PN, [2], [3], [2], [4]]),
             ("---4", [_CROSS_PN, _CROSS_PN, _CROSS_PN, [4]]),
             (".-.-.1.-.2", [_CROSS_PN, _CROSS_PN, [1], _CROSS_PN, [2]]),
+            # Doubled dots are a single separator, but every extra pair of dots adds a cross
+            ("1..4", [[1], [4]]),
+            ("1...4", [[1], _CROSS_PN, [4]]),
+            ("1.....4", [[1], _CROSS_PN, _CROSS_PN, [4]]),
+            ("1...-4", [[1], _CROSS_PN, [4]]),
+            ("", [_CROSS_PN]),
         ]
 
         for input_pn, expected_output_pn in test_cases:
             with self.subTest(input_pn=input_pn, expected_output_pn=expected_output_pn):
                 self.assertEqual(convert_pn(input_pn), expected_output_pn)
 
+    def test_valid_pn(self):
+        test_cases = [
+            ("&-1-1,2", True),
+            ("1...4", True),
+            ("x.1..-.2", True),
+            ("&-F", False),
+            ("1.?.4", False),
+        ]
+
+        for input_pn, expected_validity in test_cases:
+            with self.subTest(input_pn=input_pn, expected_validity=expected_validity):
+                self.assertEqual(valid_pn(input_pn), expected_validity)
+
+    def test_place_notation_permutation(self):
+        test_cases = [
+            (4, (), (1, 0, 3, 2)),
+            (4, (1, 4), (0, 2, 1, 3)),
+            (4, (1, 2), (0, 1, 3, 2)),
+            (5, (5,), (1, 0, 3, 2, 4)),
+            (5, (1,), (0, 2, 1, 4, 3)),
+            (6, (2, 5), (0, 1, 3, 2, 4, 5)),
+            (6, (1, 2, 3, 4), (0, 1, 2, 3, 5, 4)),
+        ]
+
+        for stage, places, expected_permutation in test_cases:
+            with self.subTest(stage=stage, places=places):
+                self.assertEqual(place_notation_permutation(stage, places), expected_permutation)
+
 
 class HelpersGenerateStartingRowTests(unittest.TestCase):
     def test_generate_without_custom_row(self):
@@ -39,12 +39,13 @@ class BellTests(unittest.TestCase):
             Bell.from_number(None)
 
     def test_equality(self):
-        for i in range(MAX_BELL):
-            for j in range(MAX_BELL):
+        bells = [Bell.from_index(i) for i in range(MAX_BELL)]
+        for i, bell_i in enumerate(bells):
+            for j, bell_j in enumerate(bells):
                 # Bells with indices `i` and `j` should be equal precisely when `i == j`
-                self.assertEqual(Bell.from_index(i) == Bell.from_index(j), i == j)
+                self.assertEqual(bell_i == bell_j, i == j)
                 # Bells with indices `i` and `j` should be not equal precisely when `i != j`
-                self.assertEqual(Bell.from_index(i) != Bell.from_index(j), i != j)
+                self.assertEqual(bell_i != bell_j, i != j)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+import unittest
+from unittest import mock
+
+from wheatley import page_parser
+
+PAGE = b'<html><head></head><body><script>var tower = { id: 1, server_ip: "https://r1.example.com" };'
+
+
+def fake_streamed_response(chunks):
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+class FindServerIPTests(unittest.TestCase):
+    def find_server_ip(self, chunks):
+        with mock.patch.object(page_parser.SESSION, "get", return_value=fake_streamed_response(chunks)):
+            return page_parser._find_server_ip("https://example.com/1")
+
+    def test_single_chunk(self):
+        self.assertEqual(self.find_server_ip([PAGE]), "https://r1.example.com")
+
+    def test_match_split_between_chunks(self):
+        # Split the page at every position inside `server_ip: "..."`, so that no single chunk contains
+        # the whole match
+        match_start = PAGE.index(b"server_ip")
+        match_end = PAGE.index(b'"', PAGE.index(b'"', match_start) + 1) + 1
+        for split in range(match_start + 1, match_end):
+            with self.subTest(split=split):
+                self.assertEqual(self.find_server_ip([PAGE[:split], PAGE[split:]]), "https://r1.example.com")
+
+    def test_stops_after_match(self):
+        chunks = iter([PAGE, b"never downloaded"])
+        self.assertEqual(self.find_server_ip(chunks), "https://r1.example.com")
+        self.assertEqual(list(chunks), [b"never downloaded"])
+
+    def test_no_match(self):
+        self.assertIsNone(self.find_server_ip([b"<html><body>", b"Tower not found", b"</body></html>"]))
+        self.assertIsNone(self.find_server_ip([]))
+
+    def test_tower_not_found(self):
+        with mock.patch.object(page_parser.SESSION, "get", return_value=fake_streamed_response([b"404"])):
+            with self.assertRaises(page_parser.TowerNotFoundError):
+                page_parser.get_load_balancing_url(1, "example.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import math
+import unittest
+
+from wheatley.bell import Bell
+from wheatley.rhythm.regression import calculate_regression, RegressionRhythm, RunningRegression
+from wheatley.stroke import HANDSTROKE, BACKSTROKE
+
+
+class CalculateRegressionTests(unittest.TestCase):
+    def test_exact_line(self):
+        # Every point lies on `real_time = 3 + 0.25 * blow_time`, so the weights shouldn't matter
+        data_set = [(b, 3 + 0.25 * b, w) for b, w in [(0, 1.0), (1, 0.5), (2, 2.0), (5, 0.1)]]
+        start, interval = calculate_regression(data_set)
+        self.assertAlmostEqual(start, 3)
+        self.assertAlmostEqual(interval, 0.25)
+
+    def test_weighted(self):
+        # The point at `(2, 3)` is off the line through the other points, but has a tiny weight so should
+        # barely affect the regression
+        data_set = [(0, 0, 1.0), (1, 1, 1.0), (2, 3, 1e-9), (3, 3, 1.0)]
+        start, interval = calculate_regression(data_set)
+        self.assertAlmostEqual(start, 0, places=6)
+        self.assertAlmostEqual(interval, 1, places=6)
+
+    def test_unweighted_least_squares(self):
+        # With equal weights, this is a normal least-squares fit:
+        # mean_b = 1.5, mean_r = 2, Sbb = 5, Sbr = 6 => interval = 1.2, start = 0.2
+        data_set = [(0, 0, 1.0), (1, 2, 1.0), (2, 2, 1.0), (3, 4, 1.0)]
+        start, interval = calculate_regression(data_set)
+        self.assertAlmostEqual(start, 0.2)
+        self.assertAlmostEqual(interval, 1.2)
+
+    def test_unix_timestamps(self):
+        # Real times are Unix timestamps, which are huge compared to the spacing between bells
+        data_set = [
+            (1000 + b, 1.7e9 + 0.2 * b + e, 1.0) for b, e in [(0, 0.01), (1, -0.01), (2, 0.01), (3, -0.01)]
+        ]
+        start, interval = calculate_regression(data_set)
+        self.assertAlmostEqual(start + interval * 1000, 1.7e9 + 0.006, places=5)
+        self.assertAlmostEqual(interval, 0.196, places=6)
+
+
+class RunningRegressionTests(unittest.TestCase):
+    def test_sliding_window(self):
+        # Slide a window of 15 points along a long, slightly noisy touch, checking that the running sums
+        # always agree with doing the whole regression from scratch
+        regression = RunningRegression()
+        window = []
+        for i in range(2000):
+            data_point = (i * 1.05, 1.7e9 + 0.2 * i + 0.01 * math.sin(i), 0.5 + 0.5 * math.cos(i) ** 2)
+            regression.add(*data_point)
+            window.append(data_point)
+            if len(window) >= 15:
+                regression.remove_oldest()
+                del window[0]
+
+            if len(window) >= 4:
+                start, interval = regression.regression()
+                expected_start, expected_interval = calculate_regression(window)
+                self.assertAlmostEqual(interval, expected_interval, places=9)
+                # Compare the times of the latest blow, since the start times are huge extrapolations
+                self.assertAlmostEqual(
+                    start + interval * data_point[0],
+                    expected_start + expected_interval * data_point[0],
+                    places=5,
+                )
+        self.assertEqual(list(regression), window)
+
+    def test_clear(self):
+        regression = RunningRegression()
+        for i in range(10):
+            regression.add(i, 2 * i, 1.0)
+        regression.clear()
+        self.assertEqual(len(regression), 0)
+        for i in range(4):
+            regression.add(i, 5 + 3 * i, 1.0)
+        start, interval = regression.regression()
+        self.assertAlmostEqual(start, 5)
+        self.assertAlmostEqual(interval, 3)
+
+
+class RegressionRhythmTests(unittest.TestCase):
+    def setUp(self):
+        self.rhythm = RegressionRhythm(0.5)
+        self.rhythm.initialise_line(8, True, 100.0, 1)
+
+    def test_expected_bell(self):
+        treble = Bell.from_number(1)
+        self.rhythm.expect_bell(treble, 0, 0, HANDSTROKE)
+        self.rhythm.on_bell_ring(treble, HANDSTROKE, 101.0)
+        self.assertEqual(list(self.rhythm.data_set), [(0, 101.0, 1)])
+
+        # The bell is no longer expected once it has rung
+        self.rhythm.on_bell_ring(treble, HANDSTROKE, 102.0)
+        self.assertEqual(len(self.rhythm.data_set), 1)
+
+    def test_unexpected_bells(self):
+        self.rhythm.expect_bell(Bell.from_number(2), 0, 1, HANDSTROKE)
+        # Wrong stroke, a bell that isn't expected and a bell beyond any that have been expected
+        self.rhythm.on_bell_ring(Bell.from_number(2), BACKSTROKE, 101.0)
+        self.rhythm.on_bell_ring(Bell.from_number(1), HANDSTROKE, 101.0)
+        self.rhythm.on_bell_ring(Bell.from_number(12), HANDSTROKE, 101.0)
+        self.assertEqual(list(self.rhythm.data_set), [])
+
+    def test_pull_off_event(self):
+        # The user is ringing the treble, so Wheatley has to wait for them to pull off
+        self.assertFalse(self.rhythm._pulled_off.is_set())
+        treble = Bell.from_number(1)
+        self.rhythm.expect_bell(treble, 0, 0, HANDSTROKE)
+        self.rhythm.on_bell_ring(treble, HANDSTROKE, 101.0)
+        self.assertTrue(self.rhythm._pulled_off.is_set())
+
+        # If Wheatley rings the treble, there's nothing to wait for
+        self.rhythm.initialise_line(8, False, 100.0, 1)
+        self.assertTrue(self.rhythm._pulled_off.is_set())
+
+    def test_wait_for_pull_off(self):
+        treble = Bell.from_number(1)
+        self.rhythm.expect_bell(treble, 0, 0, HANDSTROKE)
+        waits = []
+
+        def patched_wait_for_event(event, timeout):
+            waits.append((event.is_set(), timeout))
+            # The user pulls off the treble while Wheatley is waiting
+            self.rhythm.on_bell_ring(treble, HANDSTROKE, 101.0)
+            return event.is_set()
+
+        self.rhythm.wait_for_event = patched_wait_for_event
+        self.rhythm.wait_for_bell_time(100.0, treble, 0, 0, True, HANDSTROKE)
+        # Ringing the treble should end the wait straight away, rather than needing another timeout
+        self.assertEqual(waits, [(False, 0.1)])
+        self.assertTrue(self.rhythm._pulled_off.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
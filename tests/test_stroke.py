@@ -1,3 +1,4 @@
+import copy
 import unittest
 from wheatley.stroke import Stroke, HANDSTROKE, BACKSTROKE
 
@@ -15,6 +16,13 @@ class StrokeTests(unittest.TestCase):
         self.assertEqual(HANDSTROKE, Stroke(True))
         self.assertEqual(BACKSTROKE, Stroke(False))
 
+    def test_shared_instances(self):
+        self.assertIs(Stroke(True), HANDSTROKE)
+        self.assertIs(Stroke(False), BACKSTROKE)
+        self.assertIs(copy.deepcopy(HANDSTROKE), HANDSTROKE)
+        self.assertIs(Stroke.from_index(3), BACKSTROKE)
+        self.assertIs(BACKSTROKE.opposite(), HANDSTROKE)
+
     def test_is_hand(self):
         self.assertEqual(HANDSTROKE.is_hand(), True)
         self.assertEqual(BACKSTROKE.is_hand(), False)
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from wheatley import web
+
+URL = "https://example.com/rows"
+
+
+def fake_response(status_code, text="", etag=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = {} if etag is None else {"ETag": etag}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+class GetCachedTests(unittest.TestCase):
+    def setUp(self):
+        # Point the cache at an empty directory, and stop any requests reaching the network
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        environ_patch = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name})
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+        get_patch = mock.patch.object(web.SESSION, "get")
+        self.get = get_patch.start()
+        self.addCleanup(get_patch.stop)
+
+    def test_response_with_etag_is_cached(self):
+        self.get.return_value = fake_response(200, "body", etag='"v1"')
+        self.assertEqual(web.get_cached(URL), "body")
+        self.assertTrue(os.path.exists(web._cache_path(URL)))
+
+        # The next request should revalidate the cached copy
+        self.get.return_value = fake_response(304)
+        self.assertEqual(web.get_cached(URL), "body")
+        self.assertEqual(self.get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_not_modified_refreshes_cache(self):
+        self.get.return_value = fake_response(200, "body", etag='"v1"')
+        web.get_cached(URL)
+        # Make the cached copy look a day old
+        a_day_ago = time.time() - 24 * 60 * 60
+        os.utime(web._cache_path(URL), (a_day_ago, a_day_ago))
+
+        self.get.return_value = fake_response(304)
+        self.assertEqual(web.get_cached(URL), "body")
+        self.assertGreater(os.path.getmtime(web._cache_path(URL)), a_day_ago + 60)
+
+    def test_fresh_cache_skips_request(self):
+        self.get.return_value = fake_response(200, "body", etag='"v1"')
+        web.get_cached(URL, max_age=60)
+        self.get.reset_mock()
+
+        self.assertEqual(web.get_cached(URL, max_age=60), "body")
+        self.get.assert_not_called()
+        # Without a `max_age`, the cached copy is always revalidated
+        self.get.return_value = fake_response(304)
+        self.assertEqual(web.get_cached(URL), "body")
+        self.get.assert_called_once()
+
+    def test_http_error_is_not_cached(self):
+        self.get.return_value = fake_response(404, "not found", etag='"v1"')
+        with self.assertRaises(requests.HTTPError):
+            web.get_cached(URL)
+        self.assertFalse(os.path.exists(web._cache_path(URL)))
+
+    def test_uncached_request(self):
+        self.get.return_value = fake_response(200, "private body", etag='"v1"')
+        self.assertEqual(web.get_cached(URL, cache=False), "private body")
+        self.assertFalse(os.path.exists(web._cache_path(URL)))
+
+
+if __name__ == "__main__":
+    unittest.main()
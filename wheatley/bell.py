@@ -3,16 +3,21 @@ A module to contain a Bell class used to encapsulate the idea of a Bell and remo
 errors related to deciding whether the treble is bell #0 or bell #1.
 """
 
-from typing import Any
+from typing import Any, Tuple
 
 
 BELL_NAMES = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "E", "T", "A", "B", "C", "D"]
 MAX_BELL = len(BELL_NAMES)
+# Maps each bell name back to its 0-indexed index
+_BELL_INDICES = {name: index for index, name in enumerate(BELL_NAMES)}
 
 
 class Bell:
     """A class to encapsulate the idea of a bell."""
 
+    # A Bell is created for every bell of every row, so don't give each one its own `__dict__`
+    __slots__ = ("index",)
+
     @classmethod
     def from_str(cls, bell_str: str) -> "Bell":
         """
@@ -21,11 +26,11 @@ class Bell:
         the treble, and Bell.from_str('T') will represent the twelfth.
         """
         try:
-            index = BELL_NAMES.index(bell_str)
-        except ValueError as e:
+            index = _BELL_INDICES[bell_str]
+        except KeyError as e:
             raise ValueError(f"'{bell_str}' is not known bell symbol") from e
 
-        return cls(index)
+        return _BELLS[index]
 
     @classmethod
     def from_number(cls, bell_num: int) -> "Bell":
@@ -33,6 +38,9 @@ class Bell:
         Generates a Bell from a 1-indexed number, so Bell.from_number(1) will return a Bell
         representing the treble.
         """
+        if 1 <= bell_num <= MAX_BELL:
+            return _BELLS[bell_num - 1]
+        # Let the constructor raise the error
         return cls(bell_num - 1)
 
     @classmethod
@@ -41,6 +49,9 @@ class Bell:
         Generates a Bell from a 0-indexed number, so Bell.from_number(0) will return a Bell
         representing the treble.
         """
+        if 0 <= bell_index < MAX_BELL:
+            return _BELLS[bell_index]
+        # Let the constructor raise the error
         return cls(bell_index)
 
     def __init__(self, index: int) -> None:
@@ -72,3 +83,8 @@ class Bell:
     def __hash__(self) -> int:
         """Generates a has of a Bell."""
         return self.index
+
+
+# Bells are never modified after they're created, so every `Bell.from_*` call shares one of these instances
+# rather than creating a new Bell each time
+_BELLS: Tuple[Bell, ...] = tuple(Bell(index) for index in range(MAX_BELL))
@@ -29,6 +29,12 @@ INACTIVITY_EXIT_TIME = 300
 LOOK_TO_DURATION = 3.0  # seconds
 
 
+# The longest time that the main thread will block whilst waiting for 'Look To'.  Blocking waits
+# can't be interrupted by `Control-C` on Windows, so we wake up at least this often to let Python
+# handle the `KeyboardInterrupt`
+MAX_IDLE_WAIT = 1.0  # seconds
+
+
 # Bot holds a lot of state, allow it to have more fields
 # pylint: disable=too-many-instance-attributes
 class Bot:
@@ -94,6 +100,9 @@ class Bot:
             self._tower.invoke_on_stop_touch.append(self._on_stop_touch)
 
         self._is_ringing = False
+        # Set whenever `Look To` starts the ringing, so that the main thread can sleep until then
+        # rather than polling `self._is_ringing`
+        self._look_to_event = threading.Event()
         self._is_ringing_rounds = False
         self._is_ringing_opening_row = True
         # This is used as a counter - once `Go` or `Look To` is received, the number of rounds left
@@ -304,6 +313,9 @@ class Bot:
         # Start at the first place of the first row
         self.start_next_row(is_first_row=True)
 
+        # Wake the main thread, now that everything is ready for it to start ringing
+        self._look_to_event.set()
+
     def _on_go(self) -> None:
         """Callback called when a user calls 'Go'."""
         if self._is_ringing_rounds or self._is_ringing_opening_row:
@@ -383,8 +395,10 @@ class Bot:
             if len(self._row) < len(self._opening_row):
                 self._row = Row(self._row + self._opening_row[len(self._row) :])
 
-        bells = " ".join([str(bell) for bell in self._row])
-        self.logger.info(f"ROW: {bells}")
+        # Only build the row string if it's actually going to be logged
+        if self.logger.isEnabledFor(logging.INFO):
+            bells = " ".join([str(bell) for bell in self._row])
+            self.logger.info(f"ROW: {bells}")
 
     def start_next_row(self, is_first_row: bool) -> None:
         """Updates state of bot ready to ring the next row / stop ringing"""
@@ -498,7 +512,12 @@ class Bot:
             # if the tower is inactive for long enough.
             self._last_activity_time = time.time()
             while not self._is_ringing:
-                time.sleep(0.01)
+                # Sleep until either `Look To` is called or it's time to check for inactivity
+                timeout = MAX_IDLE_WAIT
+                if self._server_mode:
+                    timeout = min(timeout, self._last_activity_time + INACTIVITY_EXIT_TIME - time.time())
+                self._look_to_event.wait(max(timeout, 0.0))
+                self._look_to_event.clear()
                 if self._server_mode and time.time() > self._last_activity_time + INACTIVITY_EXIT_TIME:
                     self.logger.info(f"Timed out - no activity for {INACTIVITY_EXIT_TIME}s. Exiting.")
                     return
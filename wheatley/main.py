@@ -6,6 +6,7 @@ required to make Wheatley easily configurable.
 """
 
 import argparse
+import functools
 import logging
 import os
 import sys
@@ -13,9 +14,6 @@ import sys
 from typing import List, Optional
 
 from wheatley.rhythm import Rhythm, RegressionRhythm, WaitForUserRhythm
-from wheatley.tower import RingingRoomTower
-from wheatley.bot import Bot
-from wheatley.page_parser import get_load_balancing_url, TowerNotFoundError, InvalidURLError
 from wheatley.parsing import (
     parse_peal_speed,
     PealSpeedParseError,
@@ -36,17 +34,21 @@ from wheatley.row_generation.method_place_notation_generator import (
 from wheatley.row_generation.place_holder_generator import PlaceHolderGenerator
 from wheatley.row_generation.place_notation_generator import PlaceNotationGenerator
 
+# The modules which talk to Ringing Room (`wheatley.bot`, `wheatley.tower` and `wheatley.page_parser`) pull
+# in `socketio` and `requests`, which are slow to import.  They are only imported once the arguments have
+# been parsed, so that `--help`, `--version` and argument errors don't have to wait for them.
+
 
 def create_row_generator(args: argparse.Namespace) -> RowGenerator:
     """Generates a row generator according to the given CLI arguments."""
-    if "comp" in args and args.comp is not None and "start_row" in args and args.start_row is not None:
+    if getattr(args, "comp", None) is not None and getattr(args, "start_row", None) is not None:
         sys.exit("You may not specify a custom start row with a composition")
-    elif "comp" in args and args.comp is not None:
+    elif getattr(args, "comp", None) is not None:
         try:
             return ComplibCompositionGenerator.from_arg(args.comp)
         except (PrivateCompError, InvalidCompError) as e:
             sys.exit(f"Bad value for '--comp': {e}")
-    elif "method" in args and args.method is not None:
+    elif getattr(args, "method", None) is not None:
         try:
             return generator_from_special_title(args.method, args.start_row) or MethodPlaceNotationGenerator(
                 args.method,
@@ -57,7 +59,7 @@ def create_row_generator(args: argparse.Namespace) -> RowGenerator:
             )
         except MethodNotFoundError as e:
             sys.exit(f"Bad value for '--method': {e}")
-    elif "place_notation" in args and args.place_notation is not None:
+    elif getattr(args, "place_notation", None) is not None:
         try:
             stage, place_notation = parse_place_notation(args.place_notation)
             return PlaceNotationGenerator(
@@ -144,6 +146,9 @@ def configure_logging(verbose: bool, quietness: int) -> None:
     else:  # verboseness <= -3
         log_level = logging.CRITICAL
 
+    from wheatley.bot import Bot  # pylint: disable=import-outside-toplevel
+    from wheatley.tower import RingingRoomTower  # pylint: disable=import-outside-toplevel
+
     logging.getLogger(Bot.logger_name).setLevel(log_level)
     logging.getLogger(RingingRoomTower.logger_name).setLevel(log_level)
     logging.getLogger(RowGenerator.logger_name).setLevel(log_level)
@@ -151,14 +156,12 @@ def configure_logging(verbose: bool, quietness: int) -> None:
     logging.getLogger(WaitForUserRhythm.logger_name).setLevel(log_level)
 
 
-def server_main(override_args: Optional[List[str]], stop_on_join_tower: bool) -> None:
-    """
-    The main function of Wheatley when spawned by the Ringing Room server.
-    This has many many fewer options than the standard `main` function, on the basis that this running mode
-    is designed to take its parameters over SocketIO whilst running, rather than from the CLI args.
-    """
-    __version__ = get_version_number()
-
+# The argument parsers are only built once (and only when they're needed), because building them takes a
+# noticeable amount of time and they never change.  This matters when `main` is run many times in one
+# process, e.g. by the `integration-test-server` mode of `run-wheatley`.
+@functools.lru_cache(maxsize=None)
+def server_arg_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for `server_main`."""
     parser = argparse.ArgumentParser(
         description="A bot to fill in bells during ringingroom.com practices (server mode)."
     )
@@ -199,69 +202,14 @@ def server_main(override_args: Optional[List[str]], stop_on_join_tower: bool) ->
               ERRORs; `-qqq` prints nothing.",
     )
 
-    # Parse arguments
-    # `[1:]` is apparently needed, because sys.argv[0] is the working file of the Python interpreter
-    # which `parser.parse_args` does not want to see as an argument
-    args = parser.parse_args(sys.argv[1:] if override_args is None else override_args)
+    return parser
 
-    # Run the program
-    configure_logging(args.verbose, args.quiet)
-
-    # Log the version string to 'DEBUG'
-    logging.debug(f"Running Wheatley {__version__}")
 
-    # Args that we are currently 'missing'
-    use_up_down_in = True
-    stop_at_rounds = True
-    peal_speed = 180
-    inertia = 1
-    initial_inertia = 0
-    max_bells_in_dataset = 15
-    handstroke_gap = 1
-    use_wait = True
-    call_comps = True
-
-    tower_url = "http://127.0.0.1:" + str(args.port)
-
-    tower = RingingRoomTower(args.room_id, tower_url)
-    rhythm = create_rhythm(
-        peal_speed, inertia, max_bells_in_dataset, handstroke_gap, use_wait, initial_inertia
-    )
-    bot = Bot(
-        tower,
-        PlaceHolderGenerator(),
-        use_up_down_in,
-        stop_at_rounds,
-        call_comps,
-        rhythm,
-        user_name="Wheatley",
-        server_instance_id=args.id,
-    )
-
-    with tower:
-        tower.wait_loaded()
-
-        if args.look_to_time is not None:
-            bot.look_to_has_been_called(args.look_to_time)
-
-        if not stop_on_join_tower:
-            bot.main_loop()
-
-
-def console_main(override_args: Optional[List[str]], stop_on_join_tower: bool) -> None:
-    """
-    The main function of Wheatley, when called from the Command Line.
-    This parses the CLI arguments, creates the Rhythm, RowGenerator and Bot objects, then starts
-    Wheatley's mainloop.
-
-    The two optional arguments are used by the integration tester to give Wheatley artificial argument values
-    (override_args) and make Wheatley exit with error code 0 on joining a tower so that hanging forever
-    can be differentiated from Wheatley's normal behaviour of sitting in an infinite loop waiting for input.
-    """
+@functools.lru_cache(maxsize=None)
+def console_arg_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for `console_main`."""
     __version__ = get_version_number()
 
-    # PARSE THE ARGUMENTS
-
     parser = argparse.ArgumentParser(description="A bot to fill in bells during ringingroom.com practices")
 
     # Tower arguments
@@ -439,10 +387,83 @@ def console_main(override_args: Optional[List[str]], stop_on_join_tower: bool) -
               ERRORs; `-qqq` prints nothing.",
     )
 
+    return parser
+
+
+def server_main(override_args: Optional[List[str]], stop_on_join_tower: bool) -> None:
+    """
+    The main function of Wheatley when spawned by the Ringing Room server.
+    This has many many fewer options than the standard `main` function, on the basis that this running mode
+    is designed to take its parameters over SocketIO whilst running, rather than from the CLI args.
+    """
+    __version__ = get_version_number()
+
+    # Parse arguments
+    # `[1:]` is apparently needed, because sys.argv[0] is the working file of the Python interpreter
+    # which `parser.parse_args` does not want to see as an argument
+    args = server_arg_parser().parse_args(sys.argv[1:] if override_args is None else override_args)
+
+    # Run the program
+    configure_logging(args.verbose, args.quiet)
+
+    # Log the version string to 'DEBUG'
+    logging.debug(f"Running Wheatley {__version__}")
+
+    from wheatley.bot import Bot  # pylint: disable=import-outside-toplevel
+    from wheatley.tower import RingingRoomTower  # pylint: disable=import-outside-toplevel
+
+    # Args that we are currently 'missing'
+    use_up_down_in = True
+    stop_at_rounds = True
+    peal_speed = 180
+    inertia = 1
+    initial_inertia = 0
+    max_bells_in_dataset = 15
+    handstroke_gap = 1
+    use_wait = True
+    call_comps = True
+
+    tower_url = "http://127.0.0.1:" + str(args.port)
+
+    tower = RingingRoomTower(args.room_id, tower_url)
+    rhythm = create_rhythm(
+        peal_speed, inertia, max_bells_in_dataset, handstroke_gap, use_wait, initial_inertia
+    )
+    bot = Bot(
+        tower,
+        PlaceHolderGenerator(),
+        use_up_down_in,
+        stop_at_rounds,
+        call_comps,
+        rhythm,
+        user_name="Wheatley",
+        server_instance_id=args.id,
+    )
+
+    with tower:
+        tower.wait_loaded()
+
+        if args.look_to_time is not None:
+            bot.look_to_has_been_called(args.look_to_time)
+
+        if not stop_on_join_tower:
+            bot.main_loop()
+
+
+def console_main(override_args: Optional[List[str]], stop_on_join_tower: bool) -> None:
+    """
+    The main function of Wheatley, when called from the Command Line.
+    This parses the CLI arguments, creates the Rhythm, RowGenerator and Bot objects, then starts
+    Wheatley's mainloop.
+
+    The two optional arguments are used by the integration tester to give Wheatley artificial argument values
+    (override_args) and make Wheatley exit with error code 0 on joining a tower so that hanging forever
+    can be differentiated from Wheatley's normal behaviour of sitting in an infinite loop waiting for input.
+    """
     # Parse arguments
     # `[1:]` is apparently needed, because sys.argv[0] is the working file of the Python interpreter
     # which `parser.parse_args` does not want to see as an argument
-    args = parser.parse_args(sys.argv[1:] if override_args is None else override_args)
+    args = console_arg_parser().parse_args(sys.argv[1:] if override_args is None else override_args)
 
     # Deprecation warnings
     if args.wait:
@@ -451,6 +472,13 @@ def console_main(override_args: Optional[List[str]], stop_on_join_tower: bool) -
     # Run the program
     configure_logging(args.verbose, args.quiet)
 
+    # pylint: disable=import-outside-toplevel
+    from wheatley.bot import Bot
+    from wheatley.tower import RingingRoomTower
+    from wheatley.page_parser import get_load_balancing_url, TowerNotFoundError, InvalidURLError
+
+    # pylint: enable=import-outside-toplevel
+
     try:
         tower_url = get_load_balancing_url(args.room_id, args.url)
     except TowerNotFoundError as e:
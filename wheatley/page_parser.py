@@ -3,9 +3,21 @@ A module to store functions related to parsing the HTML of the Ringing Room towe
 things like the load-balanced URL of the socket-io server.
 """
 
+import re
 import urllib
+from typing import Optional
+
 import requests
 
+from wheatley.web import SESSION
+
+
+# Matches the following line in the rendered html of a tower page:
+# server_ip: "{{server_ip}}"
+# See https://github.com/lelandpaul/virtual-ringing-room/blob/
+#     ec00927ca57ab94fa2ff6a978ffaff707ab23a57/app/templates/ringing_room.html#L46
+_SERVER_IP_REGEX = re.compile(rb'server_ip:\s*"([^"]*)"')
+
 
 class TowerNotFoundError(ValueError):
     """An error class created whenever the user inputs an incorrect room id."""
@@ -39,6 +51,22 @@ def _fix_url(url: str) -> str:
     return corrected_url
 
 
+def _find_server_ip(url: str) -> Optional[str]:
+    """
+    Stream the tower page at a given URL, returning the value of `server_ip` as soon as it has been
+    downloaded (it's near the top of the page) or `None` if the page doesn't contain it.
+    """
+    with SESSION.get(url, timeout=30, stream=True) as response:
+        html = bytearray()
+        for chunk in response.iter_content(8192):
+            html += chunk
+            # `server_ip` may straddle two chunks, so search everything we've downloaded so far
+            server_ip_match = _SERVER_IP_REGEX.search(html)
+            if server_ip_match is not None:
+                return server_ip_match.group(1).decode("utf-8")
+    return None
+
+
 def get_load_balancing_url(tower_id: int, unfixed_http_server_url: str) -> str:
     """
     Get the URL of the socket server which (since the addition of load balancing) is not
@@ -49,19 +77,10 @@ def get_load_balancing_url(tower_id: int, unfixed_http_server_url: str) -> str:
     url = urllib.parse.urljoin(http_server_url, str(tower_id))  # type: ignore
 
     try:
-        html = requests.get(url, timeout=30).text
+        server_ip = _find_server_ip(url)
     except requests.exceptions.ConnectionError as e:
         raise InvalidURLError(http_server_url) from e
 
-    try:
-        # Trying to extract the following line in the rendered html:
-        # server_ip: "{{server_ip}}"
-        # See https://github.com/lelandpaul/virtual-ringing-room/blob/
-        #     ec00927ca57ab94fa2ff6a978ffaff707ab23a57/app/templates/ringing_room.html#L46
-        url_start_index = html.index("server_ip") + len('server_ip: "')
-        string_that_starts_with_url = html[url_start_index:]
-        load_balancing_url = string_that_starts_with_url[: string_that_starts_with_url.index('"')]
-
-        return load_balancing_url
-    except ValueError as e:
-        raise TowerNotFoundError(tower_id, http_server_url) from e
+    if server_ip is None:
+        raise TowerNotFoundError(tower_id, http_server_url)
+    return server_ip
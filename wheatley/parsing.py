@@ -4,6 +4,7 @@ A module to contain all the functions that parse command line arguments, and the
 
 from typing import Dict, NoReturn, Optional, Tuple
 import logging
+import re
 
 from wheatley.aliases import CallDef, JSON
 from wheatley.bell import Bell
@@ -92,6 +93,12 @@ class PealSpeedParseError(ValueError):
         return f"Error parsing peal speed '{self.peal_speed_string}': {self.message}"
 
 
+# Matches the common, well-formed peal speeds (e.g. '2h58', '3h04m', '3h' or '184'), so that they can be
+# parsed with a single regex match.  Anything else goes through the slower checks in `parse_peal_speed`,
+# which handle unusual spacing and explain exactly what is wrong with invalid input.
+_PEAL_SPEED_REGEX = re.compile(r"(?:([0-9]+)h)?([0-9]*)m?")
+
+
 def parse_peal_speed(peal_speed: str) -> int:
     """
     Parses a peal speed written in the format /2h58(m?)/ or /XXX(m?)/ into a number of minutes.
@@ -101,6 +108,17 @@ def parse_peal_speed(peal_speed: str) -> int:
         """Raise an exception with a useful error message."""
         raise PealSpeedParseError(peal_speed, error_text)
 
+    match = _PEAL_SPEED_REGEX.fullmatch(peal_speed)
+    if match is not None:
+        hour_string, minute_string = match.groups()
+        if hour_string is None:
+            if minute_string != "":
+                return int(minute_string)
+        else:
+            minutes = 0 if minute_string == "" else int(minute_string)
+            if minutes < 60:
+                return int(hour_string) * 60 + minutes
+
     # Strip whitespace from the argument, so that if the user is in fact insane enough to pad their
     # CLI arguments with whitespace then they can do so and not crash the program.  This also has
     # the side effect of cloning the input string so we can freely modify it.
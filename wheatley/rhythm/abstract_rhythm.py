@@ -1,5 +1,6 @@
 """ Module for the base Rhythm class, from which all other Rhythm classes inherit. """
 
+import threading
 import time
 
 from abc import ABCMeta, abstractmethod
@@ -66,3 +67,10 @@ class Rhythm(metaclass=ABCMeta):
     def sleep(self, seconds: float) -> None:  # pylint: disable=no-self-use
         """Sleeps for given number of seconds. Allows mocking in tests"""
         time.sleep(seconds)
+
+    def wait_for_event(self, event: threading.Event, timeout: float) -> bool:  # pylint: disable=no-self-use
+        """
+        Sleeps until a given event is set or for given number of seconds, whichever comes first, returning
+        whether or not the event is set.  Allows mocking in tests
+        """
+        return event.wait(timeout)
@@ -2,12 +2,10 @@
 
 import logging
 import math
+import threading
 
-from typing import Any, Dict, List, Tuple
-
-# We can disable the type checking on numpy because it is only used within this file and the interface from
-# this file to the rest of the code is type-checked.
-import numpy  # type: ignore
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional, Tuple
 
 from wheatley.stroke import Stroke
 from wheatley.bell import Bell
@@ -20,34 +18,132 @@ WEIGHT_REJECTION_THRESHOLD = 0.001
 # ===== REGRESSION FUNCTIONS =====
 
 
-def fill(index: int, item: float, length: int) -> List[float]:
-    """
-    Make an array that contains `length` 0s, but with the value at `index` replaced with `item`.
-    """
-    a = [0.0 for _ in range(length)]
-    a[index] = item
-    return a
-
-
 def calculate_regression(data_set: List[Tuple[float, float, float]]) -> Tuple[float, float]:
     """
     Calculates a weighted linear regression over the data given in data_set.
     Expects data_set to consist of 3-tuples of (blow_time, real_time, weight).
     """
-    blow_times = [b for (b, r, w) in data_set]
-    real_times = [r for (b, r, w) in data_set]
-    weights = [w for (b, r, w) in data_set]
+    # With only two unknowns, the weighted least-squares fit has a closed form, which is far cheaper than
+    # setting up matrices for such a small data set.  The real times are Unix timestamps, so we work
+    # relative to the weighted means of the data to avoid cancellation errors between huge numbers.
+    total_weight = 0.0
+    weighted_blow_time_sum = 0.0
+    weighted_real_time_sum = 0.0
+    for (b, r, w) in data_set:
+        total_weight += w
+        weighted_blow_time_sum += w * b
+        weighted_real_time_sum += w * r
+    mean_blow_time = weighted_blow_time_sum / total_weight
+    mean_real_time = weighted_real_time_sum / total_weight
+
+    blow_time_variance = 0.0
+    covariance = 0.0
+    for (b, r, w) in data_set:
+        blow_time_offset = b - mean_blow_time
+        blow_time_variance += w * blow_time_offset * blow_time_offset
+        covariance += w * blow_time_offset * (r - mean_real_time)
+
+    blow_interval = covariance / blow_time_variance
+    start_time = mean_real_time - blow_interval * mean_blow_time
+
+    return start_time, blow_interval
+
+
+class RunningRegression:
+    """
+    A weighted linear regression over a sliding window of data points, which keeps running sums of the
+    points so that adding a point, removing the oldest point or recalculating the regression line all
+    take constant time.  The data points are 3-tuples of (blow_time, real_time, weight).
+    """
 
-    num_datapoints = len(weights)
+    def __init__(self) -> None:
+        self._data_points: Deque[Tuple[float, float, float]] = deque()
+        self._reset_sums(0.0, 0.0)
+
+    def _reset_sums(self, origin_blow_time: float, origin_real_time: float) -> None:
+        # The sums are taken relative to an origin near the data points, because the real times are Unix
+        # timestamps (and would cause huge cancellation errors if used directly)
+        self._origin_blow_time = origin_blow_time
+        self._origin_real_time = origin_real_time
+        self._weight_sum = 0.0
+        self._blow_time_sum = 0.0
+        self._real_time_sum = 0.0
+        self._blow_time_squared_sum = 0.0
+        self._blow_time_real_time_sum = 0.0
+        self._updates_since_reset = 0
+
+    def _update_sums(self, blow_time: float, real_time: float, weight: float) -> None:
+        """Adds a (possibly negatively) weighted point to the running sums."""
+        b = blow_time - self._origin_blow_time
+        r = real_time - self._origin_real_time
+        self._weight_sum += weight
+        self._blow_time_sum += weight * b
+        self._real_time_sum += weight * r
+        self._blow_time_squared_sum += weight * b * b
+        self._blow_time_real_time_sum += weight * b * r
+
+    def _recalculate_sums(self) -> None:
+        """
+        Recalculates the running sums from scratch, relative to the oldest data point.  This stops rounding
+        errors from building up as points are added and removed, and keeps the origin close to the data.
+        """
+        if self._data_points:
+            (origin_blow_time, origin_real_time, _) = self._data_points[0]
+            self._reset_sums(origin_blow_time, origin_real_time)
+        else:
+            self._reset_sums(0.0, 0.0)
+        for data_point in self._data_points:
+            self._update_sums(*data_point)
+
+    def _after_update(self) -> None:
+        # Recalculating the sums once per window's worth of updates keeps the (amortised) cost constant
+        self._updates_since_reset += 1
+        if self._updates_since_reset > len(self._data_points):
+            self._recalculate_sums()
+
+    def add(self, blow_time: float, real_time: float, weight: float) -> None:
+        """Adds a new data point to the regression."""
+        if not self._data_points:
+            self._reset_sums(blow_time, real_time)
+        self._data_points.append((blow_time, real_time, weight))
+        self._update_sums(blow_time, real_time, weight)
+        self._after_update()
+
+    def remove_oldest(self) -> None:
+        """Removes the oldest data point from the regression."""
+        (blow_time, real_time, weight) = self._data_points.popleft()
+        self._update_sums(blow_time, real_time, -weight)
+        self._after_update()
+
+    def clear(self) -> None:
+        """Removes all the data points."""
+        self._data_points.clear()
+        self._reset_sums(0.0, 0.0)
+
+    def regression(self) -> Tuple[float, float]:
+        """
+        Calculates the weighted linear regression over the current data points, returning the same values
+        as `calculate_regression`.
+        """
+        mean_blow_time = self._blow_time_sum / self._weight_sum
+        mean_real_time = self._real_time_sum / self._weight_sum
+        blow_time_variance = self._blow_time_squared_sum - self._blow_time_sum * mean_blow_time
+        covariance = self._blow_time_real_time_sum - self._blow_time_sum * mean_real_time
 
-    x: numpy.ndarray = numpy.array([[1, b] for b in blow_times])
-    w: numpy.ndarray = numpy.array([fill(i, w, num_datapoints) for (i, w) in enumerate(weights)])
-    y: numpy.ndarray = numpy.array([[x] for x in real_times])
+        blow_interval = covariance / blow_time_variance
+        start_time = (
+            self._origin_real_time
+            + mean_real_time
+            - blow_interval * (self._origin_blow_time + mean_blow_time)
+        )
 
-    # Calculate (X^T * W * X)^-1 * (X^T * W * y)
-    beta = numpy.linalg.inv(x.transpose().dot(w).dot(x)).dot(x.transpose()).dot(w).dot(y)
+        return start_time, blow_interval
 
-    return beta[0][0], beta[1][0]
+    def __len__(self) -> int:
+        return len(self._data_points)
+
+    def __iter__(self) -> Iterator[Tuple[float, float, float]]:
+        return iter(self._data_points)
 
 
 # ===== UTILITY FUNCTIONS =====
@@ -76,6 +172,11 @@ def lerp(a: float, b: float, t: float) -> float:
     return (1 - t) * a + t * b
 
 
+def _expected_bell_index(bell: Bell, stroke: Stroke) -> int:
+    """Returns the index of a given bell and stroke in `RegressionRhythm._expected_bells`."""
+    return 2 * bell.index + stroke.is_back()
+
+
 # ===== RHYTHM CLASS =====
 
 
@@ -124,26 +225,35 @@ class RegressionRhythm(Rhythm):
 
         self._number_of_user_controlled_bells = 0
         # Maps a bell and a stroke to the row number and place which that bell is next expected to ring at
-        # that stroke
-        self._expected_bells: Dict[Tuple[Bell, Stroke], Tuple[int, int]] = {}
-        self.data_set: List[Tuple[float, float, float]] = []
+        # that stroke (or `None` if it isn't expected).  This is a list indexed by `_expected_bell_index`
+        # rather than a dict, so that we don't have to hash a `(Bell, Stroke)` tuple for every bell.
+        self._expected_bells: List[Optional[Tuple[int, int]]] = []
+        self.data_set = RunningRegression()
 
         self.logger = logging.getLogger(self.logger_name)
 
         self._should_return_to_mainloop = False
+        # Set whenever the first bell has been rung (or Wheatley is ringing the first bell), so that we can
+        # wait for users to pull off without polling
+        self._pulled_off = threading.Event()
 
     def _add_data_point(self, row_number: int, place: int, real_time: float, weight: float) -> None:
         # Always manage the data set, even when inertia is 1 (in case inertia gets changed whilst
         # Wheatley is ringing)
         blow_time = self.index_to_blow_time(row_number, place)
-        self.data_set.append((blow_time, real_time, weight))
-        for b, r, w in self.data_set:
-            self.logger.debug(f"Datapoint: {b:4.1f} {r - self._real_start_time:8.3f}s {w:.3f}")
-        # Filter out datapoints with extremely low weights
-        self.data_set = list(filter(lambda d: d[2] > WEIGHT_REJECTION_THRESHOLD, self.data_set))
+        # This runs for every bell, so don't format the whole data set unless it will actually be logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for b, r, w in self.data_set:
+                self.logger.debug(f"Datapoint: {b:4.1f} {r - self._real_start_time:8.3f}s {w:.3f}")
+            self.logger.debug(
+                f"Datapoint: {blow_time:4.1f} {real_time - self._real_start_time:8.3f}s {weight:.3f}"
+            )
+        # Ignore datapoints with extremely low weights
+        if weight > WEIGHT_REJECTION_THRESHOLD:
+            self.data_set.add(blow_time, real_time, weight)
         # Eventually forget about datapoints
         if len(self.data_set) >= self._max_bells_in_dataset:
-            del self.data_set[0]
+            self.data_set.remove_oldest()
 
         # The inertia is set to 0 for the first row, to make sure that there's a smooth pullof
         inertia = self._preferred_inertia if row_number > 0 else self._initial_inertia
@@ -154,12 +264,13 @@ class RegressionRhythm(Rhythm):
 
         # Only calculate the regression line if there are enough datapoints to gain a meaningful result
         if len(self.data_set) >= self._min_bells_in_dataset:
-            (new_start_time, new_blow_interval) = calculate_regression(self.data_set)
+            (new_start_time, new_blow_interval) = self.data_set.regression()
             # Lerp between the new times and the old times, according to the desired inertia
             self._start_time = lerp(new_start_time, self._start_time, inertia)
             self._blow_interval = lerp(new_blow_interval, self._blow_interval, inertia)
-            self.logger.debug(f"Start time: {self._start_time:.3f}")
-            self.logger.debug(f"Bell interval: {self._blow_interval:.3f}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Start time: {self._start_time:.3f}")
+                self.logger.debug(f"Bell interval: {self._blow_interval:.3f}")
 
     def return_to_mainloop(self) -> None:
         """
@@ -183,7 +294,8 @@ class RegressionRhythm(Rhythm):
             self.logger.debug("Waiting for pull off")
 
             while self._start_time == float("inf"):
-                self.sleep(0.01)
+                # The timeout is only a safety net - the event is set as soon as the first bell is rung
+                self.wait_for_event(self._pulled_off, 0.1)
 
             self.logger.debug("Pulled off")
 
@@ -208,8 +320,14 @@ class RegressionRhythm(Rhythm):
         _should_ have been in the ringing, and so can use that knowledge to inform the speed of the
         ringing.
         """
-        self.logger.debug(f"Expected bell {expected_bell} at index {row_number}:{place} at {expected_stroke}")
-        self._expected_bells[(expected_bell, expected_stroke)] = (row_number, place)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Expected bell {expected_bell} at index {row_number}:{place} at {expected_stroke}"
+            )
+        index = _expected_bell_index(expected_bell, expected_stroke)
+        if index >= len(self._expected_bells):
+            self._expected_bells.extend([None] * (index + 1 - len(self._expected_bells)))
+        self._expected_bells[index] = (row_number, place)
 
     def change_setting(self, key: str, value: Any, real_time: float) -> None:
         def log_warning(message: str) -> None:
@@ -257,19 +375,23 @@ class RegressionRhythm(Rhythm):
         """
         Called when a bell is rung at a given stroke.  Used as a callback from the Tower class.
         """
+        index = _expected_bell_index(bell, stroke)
+        expected_position = self._expected_bells[index] if index < len(self._expected_bells) else None
         # If this bell was expected at this stroke (i.e. is being rung by someone else)
-        if (bell, stroke) in self._expected_bells:
+        if expected_position is not None:
             # Figure out where the bell was expected in ringing space
-            (row_number, place) = self._expected_bells[(bell, stroke)]
+            (row_number, place) = expected_position
             expected_blow_time = self.index_to_blow_time(row_number, place)
             diff = self.real_time_to_blow_time(real_time) - expected_blow_time
 
-            self.logger.debug(f"{bell} off by {diff:.3f} places")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{bell} off by {diff:.3f} places")
 
             # If this was the first bell, then overwrite the start_time to update
             # the regression line
             if expected_blow_time == 0:
                 self._start_time = real_time
+                self._pulled_off.set()
 
             # Calculate the weight (which will be 1 if it is either of the first two bells to be
             # rung to not skew the data from the start)
@@ -280,7 +402,7 @@ class RegressionRhythm(Rhythm):
             # Add the bell as a datapoint with the calculated weight
             self._add_data_point(row_number, place, real_time, weight)
 
-            del self._expected_bells[(bell, stroke)]
+            self._expected_bells[index] = None
         else:
             # If this bell wasn't expected, then log that
             self.logger.warning(f"Bell {bell} unexpectedly rang at {stroke}")
@@ -293,7 +415,7 @@ class RegressionRhythm(Rhythm):
         self.stage = stage
 
         # Remove any data that's left over in the dataset from the last touch
-        self.data_set = []
+        self.data_set.clear()
 
         # Calculate the blow interval from the peal speed, asuming a peal of 5040 changes
         self._blow_interval = peal_speed_to_blow_interval(self._peal_speed, self.stage)
@@ -306,11 +428,13 @@ class RegressionRhythm(Rhythm):
             # the 2nd bell is rung, a regression line can be made
             self._add_data_point(0, 0, start_time, 1)
             self._start_time = start_time
+            self._pulled_off.set()
         else:
             # If Wheatley isn't ringing the first bell, then set the expected time of the first bell
             # to infinity so that Wheatley will wait indefinitely for the first bell to ring, and
             # then it will extrapolate from that time
             self._start_time = float("inf")
+            self._pulled_off.clear()
 
     # Linear conversions between different time measurements
     def index_to_blow_time(self, row_number: int, place: int) -> float:
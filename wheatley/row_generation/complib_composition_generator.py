@@ -1,11 +1,10 @@
 """ Contains the RowGenerator subclass for generating rows from a CompLib composition. """
 
+import itertools
 import json
 from typing import Dict, Optional, List, Tuple
 from urllib.parse import urlparse
 
-import requests
-
 from wheatley.aliases import Row
 from wheatley.stroke import Stroke
 from wheatley.bell import Bell
@@ -137,40 +136,57 @@ class ComplibCompositionGenerator(RowGenerator):
         url = self.complib_url + str(comp_id) + "/rows"
         if query_sections:
             url += "?" + "&".join(query_sections)
-        # Create an HTTP request for the rows, and deal with potential error codes
-        request_rows = requests.get(url, timeout=30)
-        if request_rows.status_code == 404:
-            raise InvalidCompError(comp_id)
-        if request_rows.status_code == 403:
-            raise PrivateCompError(comp_id)
-        request_rows.raise_for_status()
         # Parse the request responses as JSON
-        response_rows = json.loads(request_rows.text)
+        response_rows = json.loads(self._fetch_rows(comp_id, url, cache=access_key is None))
         unparsed_rows = response_rows["rows"]
         # Determine the start row of the composition
         num_starting_rounds = 0
         while unparsed_rows[num_starting_rounds][0] == unparsed_rows[0][0]:
             num_starting_rounds += 1
         self._start_stroke = Stroke.from_index(num_starting_rounds)
-        # Derive the rows, calls and stage from the JSON response
-        loaded_rows: List[Tuple[Row, List[str]]] = [
+        # Convert the parsed JSON into a format that we can read more easily when ringing.  I.e. the
+        # rounds at the start only contribute the calls that should be called in rounds ...
+        self._early_calls: Dict[int, List[str]] = {}
+        for i, (_row, calls, _property_bitmap) in enumerate(unparsed_rows[:num_starting_rounds]):
+            processed_calls = process_call_string(calls)
+            if calls != "" and processed_calls != []:
+                self._early_calls[num_starting_rounds - i] = processed_calls
+        # ... and the rest of the rows are loaded as-is.  `Bell.from_str` returns shared Bell objects, so
+        # every row is made of the same few bells.
+        self.loaded_rows: List[Tuple[Row, List[str]]] = [
             (Row([Bell.from_str(bell) for bell in row]), [] if calls == "" else process_call_string(calls))
-            for row, calls, _property_bitmap in unparsed_rows
+            for row, calls, _property_bitmap in itertools.islice(unparsed_rows, num_starting_rounds, None)
         ]
-        # Convert these parsed rows into a format that we can read more easily when ringing.  I.e.
-        # load the non-rounds rows as-is, but keep the calls that should be called in rounds
-        self.loaded_rows = loaded_rows[num_starting_rounds:]
-        self._early_calls = {
-            num_starting_rounds - i: calls
-            for i, (_row, calls) in enumerate(loaded_rows[:num_starting_rounds])
-            if calls != []
-        }
         # Set the variables from which the summary string is generated
         self.comp_id = comp_id
         self.comp_title = response_rows["title"]
         self.is_comp_private = access_key is not None
         # Propogate the initialisation up to the parent class
         super().__init__(response_rows["stage"])
+        # Once the composition has come round, the generator keeps on producing rounds with no calls.
+        # This is built now so that every row (even past the end) is ready before ringing starts.
+        self._row_after_end: Tuple[Row, List[str]] = (self.rounds(), [])
+
+    @staticmethod
+    def _fetch_rows(comp_id: int, url: str, cache: bool) -> str:
+        """
+        Fetch the rows (or load them from the cache), and deal with potential error codes.  Private
+        compositions (i.e. ones fetched with an access key) should never be written to the cache.
+        """
+        # `requests` is only imported here, so that importing the row generators (e.g. to parse arguments)
+        # stays cheap
+        import requests  # pylint: disable=import-outside-toplevel
+        from wheatley.web import get_cached  # pylint: disable=import-outside-toplevel
+
+        try:
+            return get_cached(url, cache=cache)
+        except requests.HTTPError as e:
+            status_code = None if e.response is None else e.response.status_code
+            if status_code == 404:
+                raise InvalidCompError(comp_id) from e
+            if status_code == 403:
+                raise PrivateCompError(comp_id) from e
+            raise
 
     @classmethod
     def from_arg(cls, arg: str) -> "ComplibCompositionGenerator":
@@ -185,7 +201,7 @@ class ComplibCompositionGenerator(RowGenerator):
     def _gen_row_and_calls(self, _previous_row: Row, _stroke: Stroke, index: int) -> Tuple[Row, List[str]]:
         if index < len(self.loaded_rows):
             return self.loaded_rows[index]
-        return (self.rounds(), [])
+        return self._row_after_end
 
     def _gen_row(self, previous_row: Row, stroke: Stroke, index: int) -> Row:
         # Technically, this should be unreachable, but Python doesn't have an error for that (I miss
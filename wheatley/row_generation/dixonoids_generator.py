@@ -1,11 +1,11 @@
 """ Module to hold DixonoidsGenerator, a class for generating dixonoids. """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from wheatley.aliases import Places, Row
 from wheatley.stroke import Stroke
 
-from .helpers import convert_pn
+from .helpers import convert_pn, place_notation_permutation
 from .row_generator import RowGenerator
 
 
@@ -49,26 +49,31 @@ class DixonoidsGenerator(RowGenerator):
         self.bob_rules = self._convert_pn_dict(bob_rules)
         self.single_rules = self._convert_pn_dict(single_rules)
 
+        # Every rule is a fixed place notation, so work out all their permutations up-front
+        self._plain_permutations = self._permutation_dict(self.plain_rules)
+        self._bob_permutations = self._permutation_dict(self.bob_rules)
+        self._single_permutations = self._permutation_dict(self.single_rules)
+
     def _gen_row(self, previous_row: Row, stroke: Stroke, index: int) -> Row:
         leading_bell = previous_row[0].number
         pn_index = 0 if stroke.is_hand() else 1
 
-        if self._has_bob and self.bob_rules.get(leading_bell):
-            place_notation = self.bob_rules[leading_bell][pn_index]
+        if self._has_bob and self._bob_permutations.get(leading_bell):
+            permutation = self._bob_permutations[leading_bell][pn_index]
 
             if stroke.is_back():
                 self.reset_calls()
-        elif self._has_single and self.single_rules.get(leading_bell):
-            place_notation = self.single_rules[leading_bell][pn_index]
+        elif self._has_single and self._single_permutations.get(leading_bell):
+            permutation = self._single_permutations[leading_bell][pn_index]
 
             if stroke.is_back():
                 self.reset_calls()
-        elif self.plain_rules.get(leading_bell):
-            place_notation = self.plain_rules[leading_bell][pn_index]
+        elif self._plain_permutations.get(leading_bell):
+            permutation = self._plain_permutations[leading_bell][pn_index]
         else:
-            place_notation = self.plain_rules[0][pn_index]
+            permutation = self._plain_permutations[0][pn_index]
 
-        row = self.permute(previous_row, place_notation)
+        row = self.apply_permutation(previous_row, permutation)
         return row
 
     def summary_string(self) -> str:
@@ -78,3 +83,9 @@ class DixonoidsGenerator(RowGenerator):
     @staticmethod
     def _convert_pn_dict(rules: Dict[int, List[str]]) -> Dict[int, List[Places]]:
         return {key: [convert_pn(pn)[0] for pn in places] for key, places in rules.items()}
+
+    def _permutation_dict(self, rules: Dict[int, List[Places]]) -> Dict[int, List[Tuple[int, ...]]]:
+        return {
+            key: [place_notation_permutation(self.stage, tuple(places)) for places in rule]
+            for key, rule in rules.items()
+        }
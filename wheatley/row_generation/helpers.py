@@ -1,7 +1,8 @@
 """ Helper functions for the row generation module. """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import functools
 import itertools
 import re
 
@@ -9,6 +10,10 @@ from wheatley.aliases import Places, Row
 from wheatley.bell import Bell, BELL_NAMES
 
 _CROSS_PN: Places = Places([])
+# Matches a cross (`x` or `-`) along with any `.`s around it, so that it can be normalised to `.-.`
+_CROSS_REGEX = re.compile(r"\.*[x-]\.*")
+# Maps each bell name to its 1-indexed number, so that converting a bell is one dict lookup
+_BELL_NUMBERS = {name: i + 1 for i, name in enumerate(BELL_NAMES)}
 
 STAGES = {
     "singles": 3,
@@ -41,7 +46,7 @@ def valid_pn(pn_str: str) -> bool:
     # Assumes a valid place notation string is delimited by `.`
     # These can optionally be omitted around an `-` or `x`
     # We substitute to ensure `-` is surrounded by `.` and replace any `..` caused by `--` => `.-..-.
-    dot_delimited_string = re.sub("[.]*[x-][.]*", ".-.", pn_str).strip(".&+ ")
+    dot_delimited_string = _CROSS_REGEX.sub(".-.", pn_str).strip(".&+ ")
     deduplicated_string = dot_delimited_string.replace("..", ".").split(".")
 
     # Walk the places checking for either a bell crossing or a valid bell string
@@ -65,28 +70,49 @@ def convert_pn(pn_str: str, expect_symmetric: bool = False) -> List[Places]:
         symmetric = pn_str.startswith("&")
 
     # Assumes a valid place notation string is delimited by `.`
-    # These can optionally be omitted around an `-` or `x`
-    # We substitute to ensure `-` is surrounded by `.` and replace any `..` caused by `--` => `.-..-.
-    dot_delimited_string = re.sub("[.]*[x-][.]*", ".-.", pn_str).strip(".&+ ")
-    deduplicated_string = dot_delimited_string.replace("..", ".").split(".")
-
-    # We suppress the type error here, because mypy will assign the list comprehension type 'List[object]',
-    # not 'List[Places]'.
-    converted: List[Places] = [
-        [convert_bell_string(y) for y in place] if place != "-" else _CROSS_PN  # type: ignore
-        for place in deduplicated_string
-    ]
+    # These can optionally be omitted around an `-` or `x`, so walk the string once, building up the
+    # current place and finishing it at every `.` or cross.  Dots next to a cross are ignored, but (as
+    # in the original `"..".replace`-based parser) every extra pair of dots between two places adds an
+    # empty place, i.e. a cross: `1...4` is `1.x.4`
+    converted: List[Places] = []
+    place: List[int] = []
+    dots_since_place: Optional[int] = None
+    for char in pn_str.strip(".&+ "):
+        if char == ".":
+            if place:
+                converted.append(Places(place))
+                place = []
+                dots_since_place = 0
+            if dots_since_place is not None:
+                dots_since_place += 1
+        elif char in "x-":
+            if place:
+                converted.append(Places(place))
+                place = []
+            converted.append(_CROSS_PN)
+            dots_since_place = None
+        else:
+            if dots_since_place:
+                converted.extend(Places([]) for _ in range((dots_since_place - 1) // 2))
+            dots_since_place = None
+            place.append(convert_bell_string(char))
+    if place:
+        converted.append(Places(place))
+    if not converted:
+        # An empty place notation has always been treated as a single cross
+        converted.append(_CROSS_PN)
 
     if symmetric:
-        return converted + list(reversed(converted[:-1]))
+        # Append everything but the half-lead in reverse, with a single reversed slice
+        converted.extend(converted[-2::-1])
     return converted
 
 
 def convert_bell_string(bell: str) -> int:
     """Convert a single-char string representing a bell into an integer."""
     try:
-        return BELL_NAMES.index(bell) + 1
-    except ValueError as e:
+        return _BELL_NUMBERS[bell]
+    except KeyError as e:
         raise ValueError(f"'{bell}' is not known bell symbol") from e
 
 
@@ -98,6 +124,36 @@ def convert_to_bell_string(bell: int) -> str:
     return BELL_NAMES[bell - 1]
 
 
+@functools.lru_cache(maxsize=None)
+def place_notation_permutation(stage: int, places: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Returns the permutation made by a place notation on a given stage, as a tuple of indices such that
+    the bell at index `i` of the new row comes from index `permutation[i]` of the previous row.  The
+    result is cached, since every method only uses a handful of different place notations.
+    """
+    permutation = list(range(stage))
+    # Store the places as a bitmask (stage is at most 16), so checking for a place is a single AND
+    place_mask = 0
+    for place in places:
+        place_mask |= 1 << place
+
+    i = 1
+    if places and places[0] % 2 == 0:
+        # Skip 1 for implicit lead when lowest pn is even
+        i += 1
+
+    while i < stage:
+        if place_mask & (1 << i):
+            i += 1
+            continue
+
+        # If not in place, must swap, index is 1 less than place
+        permutation[i - 1], permutation[i] = i, i - 1
+        i += 2
+
+    return tuple(permutation)
+
+
 def rounds(number_of_bells: int) -> Row:
     """Generate rounds on the given number of bells."""
     return Row([Bell.from_number(i) for i in range(1, number_of_bells + 1)])
@@ -109,13 +165,15 @@ def generate_starting_row(number_of_bells: int, start_row_string: Optional[str]
         return rounds(number_of_bells)
 
     start_row = [Bell.from_str(i) for i in start_row_string]
-    if len(start_row) > len(set(start_row)):
+    given_bells = set(start_row)
+    if len(start_row) > len(given_bells):
         raise ValueError(f"starting row '{start_row_string}' contains the same bell multiple times")
 
     # If there are more bells than given in the starting row
     # add the missing ones in sequential order as cover bells
     for i in range(1, number_of_bells + 1):
-        if Bell.from_number(i) not in start_row:
-            start_row.append(Bell.from_number(i))
+        bell = Bell.from_number(i)
+        if bell not in given_bells:
+            start_row.append(bell)
 
     return Row(start_row)
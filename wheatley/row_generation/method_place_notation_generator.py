@@ -1,10 +1,9 @@
 """ Module to hold a RowGenerator to generate rows from a method title. """
 
+import functools
 import xml.etree.ElementTree as ET
 from typing import Optional, Tuple
 
-import requests
-
 from wheatley.aliases import CallDef
 
 from .dixonoids_generator import DixonoidsGenerator
@@ -14,6 +13,14 @@ from .place_notation_generator import PlaceNotationGenerator
 from .row_generator import RowGenerator
 
 
+# The XML namespace used by the methods.ringing.org method library, in the form expected by
+# `ElementTree`'s `find` methods
+METHOD_XML_NAMESPACES = {"m": "http://methods.ringing.org/NS/method"}
+# Method definitions almost never change, so a cached definition is used for up to a week before asking
+# the method library whether it has changed
+METHOD_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+
 def generator_from_special_title(
     method_title: str, start_row: Optional[str] = None
 ) -> Optional[RowGenerator]:
@@ -94,21 +101,23 @@ class MethodPlaceNotationGenerator(PlaceNotationGenerator):
 
     @staticmethod
     def _parse_xml(method_xml: str) -> Tuple[str, int, str]:
-        method_parsed_xml = ET.fromstring(method_xml)
-        xmlns = "{http://methods.ringing.org/NS/method}"
+        # Schema at http://methods.ringing.org/xml.html.  Find the `<method>` element once, and then
+        # search relative to it rather than re-walking the whole tree from the root for every field
+        method_elem = ET.fromstring(method_xml).find("m:method", METHOD_XML_NAMESPACES)
+        if method_elem is None:
+            raise AttributeError("No method found in XML")
 
         # Unpack the title
-        title_elems = method_parsed_xml.findall(xmlns + "method/" + xmlns + "title")
-        if len(title_elems) == 0:
+        title_elem = method_elem.find("m:title", METHOD_XML_NAMESPACES)
+        if title_elem is None:
             raise AttributeError("No method title found in XML")
-        title: Optional[str] = title_elems[0].text
+        title: Optional[str] = title_elem.text
         assert title is not None
 
-        # Schema at http://methods.ringing.org/xml.html
-        symblock = method_parsed_xml.findall(xmlns + "method/" + xmlns + "pn/" + xmlns + "symblock")
-        block = method_parsed_xml.findall(xmlns + "method/" + xmlns + "pn/" + xmlns + "block")
+        symblock = method_elem.findall("m:pn/m:symblock", METHOD_XML_NAMESPACES)
+        block = method_elem.find("m:pn/m:block", METHOD_XML_NAMESPACES)
         # Unpack the stage piece-by-piece to appease the type checker and assert expected types at runtime
-        maybe_stage_str = method_parsed_xml.find(xmlns + "method/" + xmlns + "stage")
+        maybe_stage_str = method_elem.find("m:stage", METHOD_XML_NAMESPACES)
         assert maybe_stage_str is not None
         stage_str = maybe_stage_str.text
         assert isinstance(stage_str, str)
@@ -119,17 +128,21 @@ class MethodPlaceNotationGenerator(PlaceNotationGenerator):
             lead_end = symblock[1].text
             return f"&{notation},&{lead_end}", stage, title
 
-        if len(block) != 0:
-            notation = block[0].text
+        if block is not None:
+            notation = block.text
             assert notation is not None
             return notation, stage, title
 
         raise PlaceNotationNotFoundError(title)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _fetch_method(method_title: str) -> str:
-        params = {"title": method_title, "fields": "title|pn|stage"}
-        source = requests.get("http://methods.ringing.org/cgi-bin/simple.pl", params=params, timeout=30)
-        source.raise_for_status()
+        # Also cache in memory, since server-mode Wheatley creates a new generator for every touch.
+        # `wheatley.web` (and therefore `requests`) is only imported when a method is actually fetched.
+        from wheatley.web import get_cached  # pylint: disable=import-outside-toplevel
 
-        return source.text
+        params = {"title": method_title, "fields": "title|pn|stage"}
+        return get_cached(
+            "http://methods.ringing.org/cgi-bin/simple.pl", params=params, max_age=METHOD_CACHE_MAX_AGE
+        )
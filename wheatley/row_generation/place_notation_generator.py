@@ -1,11 +1,11 @@
 """ A module to hold the row generator that generates rows given some place notations. """
 
-from typing import ClassVar, List, Dict, Optional
+from typing import ClassVar, List, Optional, Tuple
 
-from wheatley.aliases import CallDef, Row, Places
+from wheatley.aliases import CallDef, Row
 from wheatley.stroke import Stroke
 
-from .helpers import convert_pn, convert_to_bell_string
+from .helpers import convert_pn, convert_to_bell_string, place_notation_permutation
 from .row_generator import RowGenerator
 
 
@@ -35,13 +35,21 @@ class PlaceNotationGenerator(RowGenerator):
 
         self.method_pn = convert_pn(method)
         self.lead_len = len(self.method_pn)
+        # Convert each place notation into the permutation it makes up-front, so that generating a
+        # row of the plain method is a single gather
+        self._method_permutations: List[Tuple[int, ...]] = [
+            place_notation_permutation(stage, tuple(places)) for places in self.method_pn
+        ]
         # Store the method place notation as a string for the summary string
         self.method_pn_string = method
         self.start_index = start_index
 
-        def parse_call_dict(unparsed_calls: CallDef) -> Dict[int, List[Places]]:
-            """Parse a dict of type `int => str` to `int => [PlaceNotation]`."""
-            parsed_calls = {}
+        def parse_call_dict(unparsed_calls: CallDef) -> List[List[Tuple[int, ...]]]:
+            """
+            Parse a dict of type `int => str` to a list of `[Permutation]`, with one entry for every
+            row of the lead (empty if there is no call at that point in the lead).
+            """
+            parsed_calls: List[List[Tuple[int, ...]]] = [[] for _ in range(self.lead_len)]
 
             for i, place_notation_str in unparsed_calls.items():
                 # Parse the place notation string into a list of place notations, adjust the
@@ -49,15 +57,19 @@ class PlaceNotationGenerator(RowGenerator):
                 # the lead end regardless of how long the calls are).
                 converted_place_notations = convert_pn(place_notation_str)
 
-                # Add the processed call to the output dictionary
-                parsed_calls[(i - 1) % self.lead_len] = converted_place_notations
+                # Add the processed call to the output dictionary, already converted to permutations
+                parsed_calls[(i - 1) % self.lead_len] = [
+                    place_notation_permutation(stage, tuple(places)) for places in converted_place_notations
+                ]
 
             return parsed_calls
 
         self.bobs_pn = parse_call_dict(bob)
         self.singles_pn = parse_call_dict(single)
 
-        self._generating_call_pn: List[Places] = []
+        # The permutations of the call currently being rung, and how many of them have been used
+        self._generating_call_pn: List[Tuple[int, ...]] = []
+        self._generating_call_index = 0
 
     def summary_string(self) -> str:
         """Returns a short string summarising the RowGenerator."""
@@ -67,21 +79,22 @@ class PlaceNotationGenerator(RowGenerator):
         assert self.lead_len > 0
         lead_index = (index + self.start_index) % self.lead_len
 
-        if self._has_bob and self.bobs_pn.get(lead_index):
-            self._generating_call_pn = list(self.bobs_pn[lead_index])
+        if self._has_bob and self.bobs_pn[lead_index]:
+            self._generating_call_pn = self.bobs_pn[lead_index]
+            self._generating_call_index = 0
             self.logger.info(f"Bob at index {lead_index}")
             self.reset_calls()
-        elif self._has_single and self.singles_pn.get(lead_index):
-            self._generating_call_pn = list(self.singles_pn[lead_index])
+        elif self._has_single and self.singles_pn[lead_index]:
+            self._generating_call_pn = self.singles_pn[lead_index]
+            self._generating_call_index = 0
             self.logger.info(f"Single at index {lead_index}")
             self.reset_calls()
 
-        if self._generating_call_pn:
-            place_notation = self._generating_call_pn.pop(0)
-        else:
-            place_notation = self.method_pn[lead_index]
-
-        return self.permute(previous_row, place_notation)
+        if self._generating_call_index < len(self._generating_call_pn):
+            permutation = self._generating_call_pn[self._generating_call_index]
+            self._generating_call_index += 1
+            return self.apply_permutation(previous_row, permutation)
+        return self.apply_permutation(previous_row, self._method_permutations[lead_index])
 
     def start_stroke(self) -> Stroke:
         return Stroke.from_index(self.start_index)
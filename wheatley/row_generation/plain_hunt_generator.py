@@ -1,19 +1,29 @@
 """ A module to hold a row generator that produces plain hunt on any (even) stage. """
 
-from wheatley.aliases import Places, Row
+from typing import Optional
+
+from wheatley.aliases import Row
 from wheatley.stroke import Stroke
 
+from .helpers import place_notation_permutation
 from .row_generator import RowGenerator
 
 
 class PlainHuntGenerator(RowGenerator):
     """A row generator to create plain hunt on any stage."""
 
+    def __init__(self, stage: int, start_row: Optional[str] = None) -> None:
+        super().__init__(stage, start_row)
+
+        # Plain hunt only ever uses two place notations, so work out their permutations up-front
+        self._hand_permutation = place_notation_permutation(stage, ())
+        self._back_permutation = place_notation_permutation(stage, (1, stage))
+
     def summary_string(self) -> str:
         """Returns a short string summarising the RowGenerator."""
         return f"Plain Hunt on {self.stage}"
 
     def _gen_row(self, previous_row: Row, stroke: Stroke, index: int) -> Row:
         if stroke.is_hand():
-            return self.permute(previous_row, Places([]))
-        return self.permute(previous_row, Places([1, self.stage]))
+            return self.apply_permutation(previous_row, self._hand_permutation)
+        return self.apply_permutation(previous_row, self._back_permutation)
@@ -5,7 +5,7 @@ from typing import Dict, List, Tuple, Optional
 from abc import ABCMeta, abstractmethod
 
 from wheatley.row_generation.helpers import rounds
-from wheatley.aliases import Row, Places
+from wheatley.aliases import Row
 from wheatley.stroke import Stroke, HANDSTROKE
 from wheatley.row_generation.helpers import generate_starting_row
 
@@ -20,6 +20,7 @@ class RowGenerator(metaclass=ABCMeta):
         self.custom_start_row = start_row
         self.start_row = generate_starting_row(stage, start_row)
         self.logger = logging.getLogger(self.logger_name)
+        self._rounds = rounds(stage)
 
         self._has_bob = False
         self._has_single = False
@@ -67,8 +68,11 @@ class RowGenerator(metaclass=ABCMeta):
         self._has_single = True
 
     def rounds(self) -> Row:
-        """Generate rounds of the stage given by this RowGenerator."""
-        return rounds(self.stage)
+        """
+        Gets rounds on the stage given by this RowGenerator.  The same Row is returned every time, so it
+        must not be modified.
+        """
+        return self._rounds
 
     @abstractmethod
     def _gen_row(self, previous_row: Row, stroke: Stroke, index: int) -> Row:
@@ -104,22 +108,11 @@ class RowGenerator(metaclass=ABCMeta):
         'Wheatley (will ring|is ringing) {summary_string}'.
         """
 
-    def permute(self, row: Row, places: Places) -> Row:
-        """Permute a row by a place notation given by `places`."""
-        new_row = list(row)
-
-        i = 1
-        if places and places[0] % 2 == 0:
-            # Skip 1 for implicit lead when lowest pn is even
-            i += 1
-
-        while i < self.stage:
-            if i in places:
-                i += 1
-                continue
-
-            # If not in place, must swap, index is 1 less than place
-            new_row[i - 1], new_row[i] = new_row[i], new_row[i - 1]
-            i += 2
-
-        return Row(new_row)
+    def apply_permutation(self, row: Row, permutation: Tuple[int, ...]) -> Row:
+        """Rearrange a row by a permutation generated by `place_notation_permutation`."""
+        bells = [row[i] for i in permutation]
+        # Any bells beyond the stage (e.g. from a long custom start row) stay where they are.  This is
+        # rare, so only then do we pay for slicing them off and copying them across.
+        if len(row) > self.stage:
+            bells.extend(row[self.stage :])
+        return Row(bells)
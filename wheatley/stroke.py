@@ -1,13 +1,23 @@
 """ A module containing a type that encapsulates a stroke. """
 
-from typing import Any
+from typing import Any, Dict, Tuple
 
 
 class Stroke:
     """A new-type of 'bool' that encapsulates a stroke: i.e. HANDSTROKE or BACKSTROKE."""
 
-    def __init__(self, is_handstroke: bool) -> None:
-        self._is_handstroke = is_handstroke
+    __slots__ = ("_is_handstroke",)
+    _is_handstroke: bool
+
+    def __new__(cls, is_handstroke: bool) -> "Stroke":
+        # There are only two strokes, so every `Stroke(...)` returns one of two shared instances
+        is_handstroke = bool(is_handstroke)
+        stroke = _STROKES.get(is_handstroke)
+        if stroke is None:
+            stroke = super().__new__(cls)
+            stroke._is_handstroke = is_handstroke
+            _STROKES[is_handstroke] = stroke
+        return stroke
 
     def is_hand(self) -> bool:
         """Returns true if this Stroke represents a handstroke.
@@ -24,11 +34,12 @@ class Stroke:
     @classmethod
     def from_index(cls, index: int) -> "Stroke":
         """Returns the stroke of the row that would exist at a given index."""
-        return cls(index % 2 == 0)
+        return HANDSTROKE if index % 2 == 0 else BACKSTROKE
 
     def opposite(self) -> "Stroke":
         """Returns the opposite Stroke to the current one."""
-        return Stroke(not self._is_handstroke)
+        # There are only two strokes, so return the shared instances rather than creating a new Stroke
+        return BACKSTROKE if self._is_handstroke else HANDSTROKE
 
     def char(self) -> str:
         """Returns a single-character string of 'H' or 'B'."""
@@ -54,6 +65,13 @@ class Stroke:
     def __hash__(self) -> int:
         return self._is_handstroke.__hash__()
 
+    def __reduce__(self) -> Tuple[type, Tuple[bool]]:
+        # Make copies and unpickled Strokes go through `__new__`, so they are the shared instances too
+        return (Stroke, (self._is_handstroke,))
+
+
+_STROKES: Dict[bool, Stroke] = {}
+
 
 HANDSTROKE: Stroke = Stroke(True)
 BACKSTROKE: Stroke = Stroke(False)
@@ -0,0 +1,122 @@
+"""
+A module to hold the HTTP session shared by all the parts of Wheatley which make web requests, along
+with an on-disk cache for responses which rarely change (e.g. method definitions and compositions).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# How many connections `SESSION` keeps open to each host.  Sending more concurrent requests than this to
+# one host makes the connection pool discard the extra connections.
+MAX_CONNECTIONS_PER_HOST = 4
+
+# A single session is shared so that repeated requests to the same host can reuse one (keep-alive)
+# connection, rather than paying for a new TCP/TLS handshake every time.  Connection failures are
+# retried three times: straight away, then after 0.6s, then after 1.2s.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def _cache_path(url: str) -> str:
+    """Returns the path of the file which caches the response from a given URL."""
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    # Hash the URL, because it can contain characters that aren't valid in file names
+    file_name = hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json"
+    return os.path.join(cache_dir, "wheatley", "http", file_name)
+
+
+def _read_cache(url: str) -> Optional[Tuple[str, str]]:
+    """Returns the `(etag, body)` cached for a given URL, or `None` if nothing usable is cached."""
+    try:
+        with open(_cache_path(url), encoding="utf-8") as f:
+            cached = json.load(f)
+        return (cached["etag"], cached["body"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _cache_age(url: str) -> float:
+    """Returns how many seconds ago the response from a given URL was cached (or revalidated)."""
+    try:
+        return time.time() - os.path.getmtime(_cache_path(url))
+    except OSError:
+        return float("inf")
+
+
+def _touch_cache(url: str) -> None:
+    """Marks a cached response as having just been revalidated."""
+    try:
+        os.utime(_cache_path(url))
+    except OSError:
+        pass
+
+
+def _write_cache(url: str, etag: str, body: str) -> None:
+    """Caches a response on disk.  The cache is only an optimisation, so failing to write it is ignored."""
+    path = _cache_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file and then move it into place, so that a concurrent Wheatley (or thread)
+        # never reads a half-written cache file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "body": body}, f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def get_cached(
+    url: str,
+    params: Optional[Dict[str, str]] = None,
+    timeout: float = 30,
+    max_age: float = 0,
+    cache: bool = True,
+) -> str:
+    """
+    Sends a GET request through `SESSION` and returns the body of the response, raising
+    `requests.HTTPError` if the server returns an error code.  Responses with an ETag are cached on
+    disk, and revalidated with a conditional request so that unchanged resources aren't downloaded
+    twice.  Cached responses which were fetched or revalidated less than `max_age` seconds ago are
+    returned without contacting the server at all.  Passing `cache=False` (e.g. for responses which
+    are private) skips the cache entirely, so nothing is read from or written to disk.
+    """
+    if not cache:
+        response = SESSION.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    # Build the full URL up-front so that the query parameters become part of the cache key
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    assert full_url is not None
+
+    cached = _read_cache(full_url)
+    if cached is not None and _cache_age(full_url) < max_age:
+        return cached[1]
+    headers = {} if cached is None else {"If-None-Match": cached[0]}
+
+    response = SESSION.get(full_url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached is not None:
+        _touch_cache(full_url)
+        return cached[1]
+    response.raise_for_status()
+
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        _write_cache(full_url, etag, response.text)
+    return response.text